@@ -0,0 +1,57 @@
+"""
+compare the frames of a serial and a sharded sequence pixel by pixel
+
+renders the same model with ``frame_workers=1`` and with more workers into
+two folders and reports every png that differs - run it after changing the
+sequence renderer to check that sharding does not change the output
+
+usage::
+
+    python frame_workers_diff.py [frame_workers]
+"""
+import os
+import sys
+
+import numpy as np
+from PIL import Image
+
+from geometor.model import *
+from geometor.render import *
+
+
+def build_model() -> Model:
+    model = Model("frames")
+    A = model.set_point(0, 0, classes=["given"])
+    B = model.set_point(1, 0, classes=["given"])
+    model.construct_line(A, B)
+    model.construct_circle(A, B)
+    model.construct_circle(B, A)
+    return model
+
+
+def render(plot_name: str, frame_workers: int) -> list:
+    sequencer = Sequencer(plot_name, text_mode="mathtext", workers=1)
+    files = sequencer.plot_sequence(
+        build_model(), ["png"], frame_workers=frame_workers
+    )
+    return files["png"]
+
+
+def compare(frame_workers: int = 3):
+    serial = render("frames-serial", 1)
+    sharded = render("frames-sharded", frame_workers)
+
+    differ = 0
+    for serial_file, sharded_file in zip(serial, sharded):
+        a = np.asarray(Image.open(serial_file))
+        b = np.asarray(Image.open(sharded_file))
+        if a.shape != b.shape or (a != b).any():
+            differ += 1
+            print(f"differs: {os.path.basename(serial_file)}")
+
+    print(f"frames:  {len(serial)} serial, {len(sharded)} sharded")
+    print(f"differ:  {differ}")
+
+
+if __name__ == "__main__":
+    compare(int(sys.argv[1]) if len(sys.argv) > 1 else 3)
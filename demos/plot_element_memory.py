@@ -0,0 +1,60 @@
+"""
+measure the memory held by the PlotElement records of a model
+
+builds a grid of points and reports the memory allocated while creating the
+plot elements, in total and for the element records themselves - run it
+before and after changing the PlotElement representation to compare
+
+usage::
+
+    python plot_element_memory.py [size]
+"""
+import sys
+import tracemalloc
+
+from geometor.model import *
+from geometor.render import *
+
+
+def build_model(size: int) -> Model:
+    model = Model("memory")
+    for i in range(size):
+        for j in range(size):
+            model.set_point(i, j, classes=["given"])
+    return model
+
+
+def measure(size: int = 50):
+    model = build_model(size)
+
+    sequencer = Sequencer("memory")
+    numeric = sequencer.load_model(model)
+    sequencer.bounds = sequencer.get_view_box(*numeric.limits())
+    sequencer.set_ax_main_bounds(sequencer.bounds)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+
+    for index, el in enumerate(model):
+        plot_element = sequencer.plot_element_main(index, el, model)
+        sequencer.plot_elements.append(plot_element)
+
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    total = sum(stat.size_diff for stat in stats)
+    records = sum(
+        stat.size_diff
+        for stat in stats
+        if stat.traceback[0].filename.endswith("_elements.py")
+    )
+
+    count = len(sequencer.plot_elements)
+    print(f"elements: {count}")
+    print(f"total:    {total / 1024:.1f} KiB ({total / count:.0f} B per element)")
+    print(f"records:  {records / 1024:.1f} KiB ({records / count:.0f} B per element)")
+
+
+if __name__ == "__main__":
+    measure(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
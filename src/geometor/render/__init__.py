@@ -15,6 +15,9 @@ from geometor.model import *
 from geometor.model.utils import *
 
 from .utils import *
+from .descriptions import *
+from .writer import *
+from .manifest import *
 
 from .plotter import *
 from .sections import *
@@ -113,3 +113,102 @@ html {
     return f"HTML page created at {output_path}"
 
 
+
+
+def _create_layers_page(base_file, step_files, output_path="layers/index.html"):
+    """
+    a viewer for the layers of :meth:`Sequencer.plot_layers`
+
+    ``step_files`` is a list of ``(main, overlay)`` svg files - step ``n``
+    shows the base, the main layers up to ``n`` and the overlay of ``n``, so
+    each file is loaded once however many steps show it
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def layer(svg_file, layer_id, css_class):
+        svg_rel_path = os.path.relpath(svg_file, output_path.parent)
+        return (
+            f'        <object id="{layer_id}" class="{css_class}" '
+            f'type="image/svg+xml" data="./{svg_rel_path}"></object>\n'
+        )
+
+    head = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>SVG Layers</title>
+    <style>
+html {
+    background: black;
+}
+.layers {
+    width: 100%;
+    height: 100vh;
+    position: relative;
+}
+.layers > object {
+    position: absolute;
+    width: 100%;
+    height: 100%;
+    pointer-events: none;
+}
+.layers > .main, .layers > .overlay {
+    visibility: hidden;
+}
+    </style>
+</head>
+<body>
+    <div class="layers">
+"""
+
+    layers = layer(base_file, "base", "base")
+    for index, (main_file, overlay_file) in enumerate(step_files):
+        layers += layer(main_file, f"step-{index:05}", "main")
+        layers += layer(overlay_file, f"step-{index:05}-overlay", "overlay")
+
+    script = """    </div>
+    <script>
+        const mains = document.querySelectorAll('.layers > .main');
+        const overlays = document.querySelectorAll('.layers > .overlay');
+        let current = 0;
+
+        function showStep(index) {
+            mains.forEach((layer, i) => {
+                layer.style.visibility = i <= index ? 'visible' : 'hidden';
+            });
+            overlays.forEach((layer, i) => {
+                layer.style.visibility = i === index ? 'visible' : 'hidden';
+            });
+            current = index;
+        }
+
+        document.addEventListener('keydown', function(event) {
+            const last = mains.length - 1;
+            switch (event.key) {
+                case 'j':
+                    showStep(current < last ? current + 1 : 0);
+                    break;
+                case 'k':
+                    showStep(current > 0 ? current - 1 : last);
+                    break;
+                case 'g':
+                    showStep(0);
+                    break;
+                case 'G':
+                    showStep(last);
+                    break;
+            }
+        });
+
+        showStep(current);
+    </script>
+</body>
+</html>
+"""
+
+    with open(output_path, 'w') as file:
+        file.write(head + layers + script)
+
+    return str(output_path)
@@ -9,19 +9,19 @@ def plot_chain(plotter: Plotter, model: Model, index, chain, extensions=["svg",
     plot the chain then remove it
     """
     files = []
-    selected = []
+    overlays = plotter.overlays
 
     # annotate points
     for pt in chain.points:
         label = model[pt].label
-        selected.append(plotter.annotate_point(pt, label))
+        overlays.annotate(pt, label)
 
-    selected.append(plotter.plot_selected_points(chain.points))
+    overlays.points(chain.points)
 
     #  for segment in chain.segments:
     for segment, fib_label in zip(chain.segments, chain.fibonacci_labels):  
     
-        selected.append(plotter.plot_segment(segment, classes=[fib_label]))
+        overlays.segment(segment, classes=[fib_label])
 
     # TODO: add flow visualization using arrows or annotations 
 
@@ -35,24 +35,15 @@ def plot_chain(plotter: Plotter, model: Model, index, chain, extensions=["svg",
     folder = f"./{plotter.plot_name}/chains"
     filename = f"{index:05}"
 
-    for ext in extensions:
-        files.append(snapshot_2(folder, f"{filename}.{ext}"))
+    files.extend(plotter.snapshot(folder, filename, extensions))
 
     # zoom around chain points
     chain_pts = chain.points
-    x_limits, y_limits = get_limits_from_points(chain_pts)
-    x_limits, y_limits = plotter._add_margin_to_ax_main_limits(x_limits, y_limits)
-    x_limits, y_limits = plotter._pad_ax_main_limits_for_aspect_ratio(x_limits, y_limits)
+    plotter.zoom_to_points(chain_pts)
 
-    plotter.ax_main.set_xlim(x_limits[0], x_limits[1])
-    plotter.ax_main.set_ylim(y_limits[0], y_limits[1])
+    files.extend(plotter.snapshot(folder, f"{filename}-zoom", extensions))
 
-    for ext in extensions:
-        files.append(snapshot_2(folder, f"{filename}-zoom.{ext}"))
-
-    for select in selected:
-        selected_el = select.pop(0)
-        selected_el.remove()
+    overlays.clear()
 
     # reset view after zoom
     plotter.set_ax_main_bounds(plotter.bounds)
@@ -67,10 +58,19 @@ def plot_chains(plotter: Plotter, model: Model, chains: list, extensions=["svg",
 
     plotter.set_plotter_limits_from_points(chain_pts)
 
+    texts = [(model[pt].label, 12) for pt in chain_pts]
+    for index in range(len(chains)):
+        texts += [(index, 24), ("Chain Description", 20), (f"Chain_{index}", 24)]
+    plotter.compile_text(texts, extensions)
+
     files = []
 
-    for index, chain in enumerate(chains):
-        files.extend(plot_chain(plotter, model, index, chain))
+    plotter.start_writer()
+    try:
+        for index, chain in enumerate(chains):
+            files.extend(plot_chain(plotter, model, index, chain))
+    finally:
+        plotter.finish_writer()
 
     return files
 
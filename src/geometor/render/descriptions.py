@@ -0,0 +1,406 @@
+"""
+descriptions of elements for the footer panel
+
+the symbolic simplification behind each description is expensive, so the
+results are memoized in a shared LRU cache used by every render path and
+can be persisted across runs in a :class:`DescriptionStore`
+"""
+from __future__ import annotations
+
+from .common import *
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import NamedTuple
+import os
+import signal
+import sqlite3
+import threading
+
+from geometor.model import Wedge
+
+
+class SimplifyBudget(NamedTuple):
+    """
+    limits for simplifying a single expression
+
+    - ``seconds`` : wall time for ``simplify`` and ``sqrtdenest`` - enforced
+      with ``SIGALRM``, which only reaches the main thread of a process, so
+      other threads simplify without it and log that once
+    - ``max_ops`` : expressions with more operations than this are not
+      simplified at all
+
+    ``None`` disables a limit
+    """
+
+    seconds: float = 10.0
+    max_ops: int = 5000
+
+
+class BudgetExceeded(BaseException):
+    """raised inside a simplification that ran over its budget
+
+    derived from :class:`BaseException` like :class:`KeyboardInterrupt`, so
+    ``except Exception`` handlers within sympy cannot swallow it
+    """
+
+
+_log = logging.getLogger(__name__)
+_timer_warned = False
+
+
+def _on_main_thread() -> bool:
+    return threading.current_thread() is threading.main_thread()
+
+
+def _thread_seconds(seconds):
+    """return the time limit usable on this thread - ``None`` off the main
+    thread, where ``SIGALRM`` cannot be delivered"""
+    global _timer_warned
+    if not seconds or _on_main_thread():
+        return seconds
+    if not _timer_warned:
+        _timer_warned = True
+        _log.warning(
+            "simplify time budget unavailable off the main thread - "
+            "only max_ops is enforced"
+        )
+    return None
+
+
+@contextmanager
+def _time_limit(seconds):
+    if not seconds or not hasattr(signal, "setitimer"):
+        yield
+        return
+
+    def _on_alarm(signum, frame):
+        raise BudgetExceeded(f"over {seconds}s")
+
+    previous = signal.signal(signal.SIGALRM, _on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+class _Simplifier:
+    """
+    simplifies expressions for one description within a budget
+
+    when the budget is exceeded the unsimplified expression is used - or a
+    float approximation if it is too large to render - and the reason is
+    collected in :attr:`degraded`
+    """
+
+    def __init__(self, budget: SimplifyBudget = None):
+        self.budget = budget if budget is not None else SimplifyBudget(None, None)
+        self.degraded = []
+
+    def __call__(self, expr, denest=True):
+        max_ops = self.budget.max_ops
+        if max_ops is not None:
+            ops = sp.count_ops(expr)
+            if ops > max_ops:
+                self.degraded.append(f"{ops} ops > {max_ops}")
+                return expr.evalf(8)
+
+        try:
+            with _time_limit(_thread_seconds(self.budget.seconds)):
+                simplified = expr.simplify()
+                if denest:
+                    simplified = sp.sqrtdenest(simplified)
+        except BudgetExceeded as err:
+            self.degraded.append(str(err))
+            return expr
+        return simplified
+
+
+def _approx(expr) -> str:
+    return str(round(float(expr.evalf()), 4))
+
+
+def _describe_point(el, simplify) -> str:
+    return f"$\\left\\{{ \\ {sp.latex(el.x)}, \\ {sp.latex(el.y)} \\ \\right\\}}$"
+
+
+def _describe_line(el, simplify) -> str:
+    eq = simplify(el.equation(), denest=False)
+    dist = simplify(el.p1.distance(el.p2))
+    return f"${sp.latex(eq)} = 0$ \n $d = {sp.latex(dist)}$"
+
+
+def _describe_circle(el, simplify) -> str:
+    eq = simplify(el.equation(), denest=False)
+    rad = simplify(el.radius)
+    return f"${sp.latex(eq)} = 0$ \n $r = {sp.latex(rad)}$"
+
+
+def _describe_segment(el, simplify) -> str:
+    seg = simplify(el.length)
+    description = f"seg: ${sp.latex(seg)}$"
+    description += " $ \\approx " + _approx(seg) + "$"
+    return description
+
+
+def _describe_polygon(el, simplify) -> str:
+    area = simplify(el.area)
+    perim = simplify(el.perimeter)
+    description = f"area: ${sp.latex(area)} \\approx {_approx(area)}$ "
+    description += "\n"
+    description += f"perim: ${sp.latex(perim)} \\approx {_approx(perim)}$"
+    return description
+
+
+def _describe_wedge(el, simplify) -> str:
+    area = simplify(el.area)
+    # TODO: determine why radians create and error
+    return f"area: ${sp.latex(area)} \\approx {_approx(area)}$ "
+
+
+# bump when the description format changes to ignore stored entries
+DESCRIPTION_FORMAT = 1
+
+
+def structural_key(el) -> str:
+    """return a string key for the structure of an element
+
+    sympy elements use ``srepr`` - other elements like wedges use their type
+    and the ``srepr`` of their defining points
+    """
+    if isinstance(el, sp.Basic):
+        return sp.srepr(el)
+    return f"{type(el).__name__}({sp.srepr(tuple(el.points))})"
+
+
+_DESCRIBERS = (
+    (spg.Point, _describe_point),
+    (spg.Line, _describe_line),
+    (spg.Circle, _describe_circle),
+    (spg.Segment, _describe_segment),
+    (spg.Polygon, _describe_polygon),
+    (Wedge, _describe_wedge),
+)
+
+
+def build_description(el, budget: SimplifyBudget = None) -> tuple[str, list]:
+    """build the footer description for an element without caching
+
+    returns the description and a list of reasons the simplification was
+    degraded to stay within ``budget`` - empty if it was not
+    """
+    simplify = _Simplifier(budget)
+    for element_type, describer in _DESCRIBERS:
+        if isinstance(el, element_type):
+            return describer(el, simplify), simplify.degraded
+    return "", []
+
+
+class DescriptionStore:
+    """
+    persistent sqlite cache of descriptions across runs
+
+    entries are keyed on :func:`structural_key` and :data:`DESCRIPTION_FORMAT`
+    so a re-run with unchanged geometry skips the symbolic work entirely
+
+    parameters
+    ----------
+    - ``path`` : :class:`str`: sqlite file - parent folders are created
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS descriptions ("
+                " key TEXT NOT NULL,"
+                " format INTEGER NOT NULL,"
+                " description TEXT NOT NULL,"
+                " PRIMARY KEY (key, format))"
+            )
+
+    def get(self, element) -> str:
+        """return the stored description or ``None``"""
+        key = structural_key(element)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT description FROM descriptions WHERE key = ? AND format = ?",
+                (key, DESCRIPTION_FORMAT),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, element, description: str) -> None:
+        key = structural_key(element)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO descriptions VALUES (?, ?, ?)",
+                (key, DESCRIPTION_FORMAT, description),
+            )
+
+    def put_many(self, items) -> None:
+        """store ``(element, description)`` pairs in a single transaction"""
+        rows = [
+            (structural_key(element), DESCRIPTION_FORMAT, description)
+            for element, description in items
+        ]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO descriptions VALUES (?, ?, ?)", rows
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class DescriptionCache:
+    """
+    LRU cache of element descriptions
+
+    keyed on the element itself - sympy elements hash and compare on their
+    structure, so equal elements from different runs share an entry
+
+    when a :attr:`store` is set, misses read from it before building and
+    new descriptions are written back to it
+
+    each description is built within :attr:`budget` - elements that fell
+    back to unsimplified or approximate values are listed in
+    :attr:`degraded` and are not written to the store
+
+    attributes
+    ----------
+    - :attr:`maxsize` -> :class:`int`: number of descriptions to keep
+    - :attr:`hits` -> :class:`int`: lookups served from the cache
+    - :attr:`misses` -> :class:`int`: lookups not in memory
+    - :attr:`store` -> :class:`DescriptionStore`: optional persistent store
+    - :attr:`budget` -> :class:`SimplifyBudget`: limits per expression
+    - :attr:`degraded` -> :class:`dict`: element to list of reasons
+
+    lookups and updates are guarded by a lock, so a background thread can
+    build descriptions ahead of the renderer - building itself runs outside
+    the lock
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        store: DescriptionStore = None,
+        budget: SimplifyBudget = SimplifyBudget(),
+    ):
+        self._cache = OrderedDict()
+        self._lock = threading.RLock()
+        self._maxsize = maxsize
+        self.store = store
+        self.budget = budget
+        self.degraded = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, element, details=None) -> str:
+        """return the description for the element
+
+        ``details`` is accepted so callers can pass the model entry along -
+        descriptions currently depend on the element only
+        """
+        with self._lock:
+            description = self._cache.get(element)
+            if description is not None:
+                self.hits += 1
+                self._cache.move_to_end(element)
+                return description
+            self.misses += 1
+
+        if self.store is not None:
+            description = self.store.get(element)
+        if description is None:
+            description, degraded = build_description(element, self.budget)
+            self.seed(element, description, degraded)
+        else:
+            self._remember(element, description)
+        return description
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __contains__(self, element) -> bool:
+        return element in self._cache
+
+    def cached(self, element) -> str:
+        """return the description from memory or the store without building
+        it - ``None`` if it has not been built yet"""
+        with self._lock:
+            description = self._cache.get(element)
+        if description is None and self.store is not None:
+            description = self.store.get(element)
+            if description is not None:
+                self._remember(element, description)
+        return description
+
+    def seed(self, element, description: str, degraded: list = None) -> None:
+        """add a description built elsewhere, like a worker process"""
+        self._remember(element, description)
+        if degraded:
+            with self._lock:
+                self.degraded[element] = degraded
+        elif self.store is not None:
+            self.store.put(element, description)
+
+    def seed_many(self, entries) -> None:
+        """add ``(element, description, degraded)`` entries built elsewhere -
+        the store is written in one transaction"""
+        stored = []
+        for element, description, degraded in entries:
+            self._remember(element, description)
+            if degraded:
+                with self._lock:
+                    self.degraded[element] = degraded
+            else:
+                stored.append((element, description))
+        if self.store is not None:
+            self.store.put_many(stored)
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def _remember(self, element, description: str) -> None:
+        with self._lock:
+            self._cache[element] = description
+            self._cache.move_to_end(element)
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+
+    def info(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "maxsize": self._maxsize,
+            "currsize": len(self._cache),
+            "degraded": len(self.degraded),
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.degraded.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+describe = DescriptionCache()
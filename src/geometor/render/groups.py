@@ -12,21 +12,21 @@ def plot_group(plotter: Plotter, model: Model, index, group, description, extens
     Plot the group then remove it.
     """
     files = []
-    selected = []
+    overlays = plotter.overlays
 
     # Assuming each group is a list of Sections
     for section in group:
         # Annotate points
         for pt in section.points:
             label = model[pt].label
-            selected.append(plotter.annotate_point(pt, label))
+            overlays.annotate(pt, label)
 
         # Highlight points in the section
-        selected.append(plotter.plot_selected_points(section.points))
+        overlays.points(section.points)
 
         # Highlight segments in the section
         for segment in section.segments:
-            selected.append(plotter.plot_segment(segment))
+            overlays.segment(segment)
 
     # TODO: Add additional visualizations as needed (e.g., flow, symmetry lines)
 
@@ -38,13 +38,10 @@ def plot_group(plotter: Plotter, model: Model, index, group, description, extens
     filename = f"{index:05}"
 
     # Save plot in different formats
-    for ext in extensions:
-        files.append(snapshot_2(folder, f"{filename}.{ext}"))
+    files.extend(plotter.snapshot(folder, filename, extensions))
 
     # Clean up the annotations and highlights
-    for select in selected:
-        selected_el = select.pop(0)
-        selected_el.remove()
+    overlays.clear()
 
     return files
 
@@ -62,11 +59,24 @@ def plot_groups(
     plotter.set_plotter_limits_from_points(all_pts)
 
     title = f"{model.name}\n{title}"
+
+    texts = [(title, 20)]
+    texts += [(model[pt].label, 12) for pt in all_pts]
+    for index, key in enumerate(groups):
+        texts += [(index, 24), (str(key), 20)]
+    plotter.compile_text(texts, extensions)
+
     plotter.plot_header(title)
 
     files = []
 
-    for index, (key, group) in enumerate(groups.items()):
-        files.extend(plot_group(plotter, model, index, group, str(key), extensions))
+    plotter.start_writer()
+    try:
+        for index, (key, group) in enumerate(groups.items()):
+            files.extend(
+                plot_group(plotter, model, index, group, str(key), extensions)
+            )
+    finally:
+        plotter.finish_writer()
 
     return files
@@ -0,0 +1,237 @@
+"""
+frame manifests for skipping unchanged frames
+
+re-running a job after a small model edit renders every frame again, though
+most come out identical - a :class:`FrameManifest` keeps a hash of the inputs
+of each saved frame next to its folder, so frames whose inputs did not change
+keep their files
+
+the inputs are read from the visible artists of the figure - their numeric
+geometry, resolved styles and text - with the view limits, figure size and
+resolution, see :func:`frame_digest`
+"""
+from __future__ import annotations
+
+from .common import *
+
+import hashlib
+import json
+import os
+
+from matplotlib.axes import Axes
+from matplotlib.axis import Axis, Tick
+from matplotlib.collections import Collection
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+from matplotlib.text import Annotation, Text
+
+# rc settings that change how text is drawn
+_TEXT_PARAMS = (
+    "text.usetex",
+    "text.latex.preamble",
+    "mathtext.fontset",
+    "font.family",
+)
+
+
+def _array(values) -> bytes:
+    return np.ascontiguousarray(values, dtype=float).tobytes()
+
+
+def _line_state(line: Line2D) -> list:
+    return [
+        _array(line.get_xydata()),
+        line.get_color(),
+        line.get_linestyle(),
+        line.get_linewidth(),
+        line.get_marker(),
+        line.get_markersize(),
+        line.get_markerfacecolor(),
+        line.get_markeredgecolor(),
+        line.get_markeredgewidth(),
+        line.get_fillstyle(),
+        line.get_drawstyle(),
+    ]
+
+
+def _text_state(text: Text) -> list:
+    state = [
+        text.get_text(),
+        text.get_position(),
+        text.get_color(),
+        text.get_fontsize(),
+        text.get_fontfamily(),
+        text.get_horizontalalignment(),
+        text.get_verticalalignment(),
+        text.get_rotation(),
+        text.get_usetex(),
+    ]
+    if isinstance(text, Annotation):
+        state += [text.xy, text.xyann, text.xycoords, text.anncoords]
+    return state
+
+
+def _patch_state(patch: Patch) -> list:
+    path = patch.get_path()
+    codes = path.codes
+    return [
+        _array(path.vertices),
+        b"" if codes is None else codes.tobytes(),
+        _array(patch.get_transform().get_matrix()),
+        _array(patch.get_facecolor()),
+        _array(patch.get_edgecolor()),
+        patch.get_linewidth(),
+        patch.get_linestyle(),
+        patch.get_fill(),
+        patch.get_hatch(),
+    ]
+
+
+def _collection_state(collection: Collection) -> list:
+    return [
+        _array(collection.get_offsets()),
+        [_array(path.vertices) for path in collection.get_paths()],
+        _array(collection.get_facecolor()),
+        _array(collection.get_edgecolor()),
+        _array(collection.get_linewidth()),
+        collection.get_linestyle(),
+    ]
+
+
+def _axes_state(ax: Axes) -> list:
+    return [
+        ax.get_xlim(),
+        ax.get_ylim(),
+        ax.get_position().bounds,
+        ax.axison,
+    ]
+
+
+def _artist_states(artist, states: list) -> bool:
+    """
+    append the state of a visible artist and its children to ``states``
+
+    returns ``False`` for artists of a kind the manifest cannot describe -
+    frames with them are always rendered
+    """
+    if not artist.get_visible():
+        return True
+
+    states.append(
+        (
+            type(artist).__name__,
+            artist.get_zorder(),
+            artist.get_alpha(),
+            artist.get_gid(),
+        )
+    )
+
+    children = artist.get_children()
+    if isinstance(artist, Axes):
+        states.append(_axes_state(artist))
+        if not artist.axison:
+            # axis and spines are not drawn
+            hidden = {artist.xaxis, artist.yaxis, *artist.spines.values()}
+            children = [child for child in children if child not in hidden]
+    elif isinstance(artist, Line2D):
+        states.append(_line_state(artist))
+    elif isinstance(artist, Text):
+        states.append(_text_state(artist))
+    elif isinstance(artist, Patch):
+        states.append(_patch_state(artist))
+    elif isinstance(artist, Collection):
+        states.append(_collection_state(artist))
+    elif not isinstance(artist, (Axis, Tick)):
+        return False
+
+    return all(_artist_states(child, states) for child in children)
+
+
+def frame_digest(fig, dpi: float, transparent: bool = False) -> str:
+    """
+    return a hash of everything that is drawn to a frame of the figure, or
+    ``None`` if the figure has artists the manifest cannot describe
+    """
+    states = [
+        mp.__version__,
+        tuple(fig.get_size_inches()),
+        dpi,
+        transparent,
+        _array(fig.get_facecolor()),
+        [plt.rcParams[param] for param in _TEXT_PARAMS],
+    ]
+    for child in fig.get_children():
+        if not _artist_states(child, states):
+            return None
+    return hashlib.sha1(repr(states).encode("utf-8")).hexdigest()
+
+
+class FrameManifest:
+    """
+    input hashes of the frames saved to a folder
+
+    kept as ``<folder>.manifest.json`` next to the folder and keyed on file
+    names within it
+
+    parameters
+    ----------
+    - ``folder`` : :class:`str`: the folder of the frames
+
+    attributes
+    ----------
+    - :attr:`frames` -> :class:`dict`: file name to input hash
+    - :attr:`changes` -> :class:`dict`: hashes recorded since loading, for
+      merging the work of other processes
+    """
+
+    def __init__(self, folder: str):
+        self.folder = os.path.abspath(folder)
+        self.path = f"{self.folder}.manifest.json"
+        self.frames = {}
+        self.changes = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path) as file:
+                    self.frames = json.load(file)
+            except (OSError, ValueError):
+                # an unreadable manifest only costs a full render
+                self.frames = {}
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def unchanged(self, filename: str, digest: str) -> bool:
+        """return ``True`` if the file exists and was saved from the same
+        inputs"""
+        if digest is None:
+            return False
+        name = os.path.basename(filename)
+        return self.frames.get(name) == digest and os.path.exists(filename)
+
+    def record(self, filename: str, digest: str) -> None:
+        name = os.path.basename(filename)
+        if digest is None:
+            self.forget(name)
+            return
+        self.frames[name] = digest
+        self.changes[name] = digest
+
+    def forget(self, filename: str) -> None:
+        name = os.path.basename(filename)
+        self.frames.pop(name, None)
+        self.changes.pop(name, None)
+
+    def update(self, frames: dict) -> None:
+        self.frames.update(frames)
+        self.changes.update(frames)
+
+    def save(self) -> None:
+        """write the manifest if anything was recorded since loading"""
+        if not self.changes:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp = f"{self.path}.tmp"
+        with open(temp, "w") as file:
+            json.dump(self.frames, file, indent=0, sort_keys=True)
+        os.replace(temp, self.path)
+        self.changes = {}
@@ -1,6 +1,8 @@
 
 from __future__ import annotations
 
+import os
+
 from ..common import *
 from ..styles import *
 
@@ -8,17 +10,42 @@ from ._points import (
     _plot_point,
     _plot_selected_points,
     _plot_circle_points,
+    _plot_point_layer,
+    PointLayer,
 )
 from ._lines import _plot_line, _plot_selected_line
 from ._circles import _plot_circle, _plot_selected_circle
 from ._segments import _plot_segment, _plot_line_segment, _plot_circle_radius
 from ._polygons import _plot_polygon
-from ._wedges import _plot_wedge, Wedge
+from ._wedges import _plot_wedge, _plot_wedges, wedge_params, Wedge
+
+from ._elements import (
+    _plot_element,
+    _plot_element_main,
+    _plot_element_overlays,
+    PlotElement,
+    ArtistRegistry,
+)
+from ._coords import CoordCache
+from ._numeric import NumericModel
+from ._clip import LineClipper, clip_lines
+from ._text import TextCache, CachedText, mathtext_supported, TEXT_MODES
+from ._latex import compile_tex, tex_lines
+from ._batch import _plot_batched, BatchIndex
+from ._overlays import OverlayPool
 
-from ._elements import _plot_element, PlotElement
+from matplotlib.textpath import TextToPath
 
 from geometor.model import Model
 from geometor.render.utils import *
+from geometor.render.descriptions import describe, DescriptionStore
+from geometor.render.writer import (
+    SnapshotWriter,
+    SnapshotError,
+    save_frame,
+    RASTER_FORMATS,
+)
+from geometor.render.manifest import FrameManifest, frame_digest
 
 
 class Plotter:
@@ -39,6 +66,21 @@ class Plotter:
     - :attr:`ax_header` -> :class:`matplotlib.axes.Axes`: Axes for the header panel
     - :attr:`ax_footer` -> :class:`matplotlib.axes.Axes`: Axes for the footer panel
     - :attr:`figure` -> :class:`matplotlib.figure.Figure`: the main figure of the plot
+    - :attr:`coords` -> :class:`CoordCache`: float coordinates of elements for the run
+    - :attr:`numeric` -> :class:`NumericModel`: float mirror of the loaded model
+    - :attr:`bounds` -> :class:`ViewBox`: full view limits of the main axes
+    - :attr:`text_cache` -> :class:`TextCache`: glyph paths for text, if enabled
+    - :attr:`overlays` -> :class:`OverlayPool`: reusable selection and
+      annotation artists
+    - :attr:`writer` -> :class:`SnapshotWriter`: background writer for the
+      running job, if ``write_threads`` is set
+    - :attr:`manifests` -> :class:`dict`: folder to :class:`FrameManifest`
+      of the saved frames, if ``skip_unchanged`` is set
+    - :attr:`batches` -> :class:`BatchIndex`: element to ``(artist, index)``
+      after a batched :meth:`plot_model`
+    - :attr:`text_mode` -> :class:`str`: ``usetex``, ``auto`` or ``mathtext``
+    - :attr:`text_counts` -> :class:`dict`: number of strings drawn with
+      each of ``usetex`` and ``mathtext``
 
     methods
     -------
@@ -53,6 +95,10 @@ class Plotter:
         margin_ratio=0.1,
         FIG_W=16,
         FIG_H=9,
+        text_cache: bool = False,
+        text_mode: str = "usetex",
+        write_threads: int = 0,
+        skip_unchanged: bool = False,
     ):
         """
         Initializes the Sequencer with the given model and optional parameters.
@@ -62,7 +108,19 @@ class Plotter:
             model (Model): The geometric model to be processed and plotted.
             plot_name (str, optional): An optional name for the plot.
             margin (float, optional): An optional parameter to control the margins of the plot.
+            text_cache (bool, optional): draw header, footer and labels from
+                cached glyph paths instead of laying out latex on every frame.
+            text_mode (str, optional): ``usetex`` renders all text with latex,
+                ``auto`` uses mathtext where it can render the string and
+                ``mathtext`` never uses latex.
+            write_threads (int, optional): threads encoding and writing saved
+                frames in the background - ``0`` saves synchronously.
+            skip_unchanged (bool, optional): keep the files of frames whose
+                inputs match the manifest of their folder.
         """
+        if text_mode not in TEXT_MODES:
+            raise ValueError(f"text_mode must be one of {TEXT_MODES}")
+
         self.plot_name = plot_name
 
         self.margin_ratio = margin_ratio
@@ -73,6 +131,9 @@ class Plotter:
             "text.usetex": True,
             "text.latex.preamble": r"\usepackage{amsmath} \usepackage{xcolor}",  # for the align enivironment
         }
+        if text_mode != "usetex":
+            # closest built-in match to the latex fonts
+            custom_preamble["mathtext.fontset"] = "cm"
         plt.rcParams.update(custom_preamble)
 
         self.FIG_H = FIG_H
@@ -83,12 +144,29 @@ class Plotter:
         )
         plt.tight_layout()
 
+        self.overlays = OverlayPool(self)
         self.reset_ax_all()
 
         self.cursor = mplcursors.cursor()
         self.cursor_points = []
 
         self.plot_elements = []
+        self.artist_registry = ArtistRegistry()
+
+        self.coords = CoordCache()
+        self.numeric = None
+        self.batches = None
+        self.clipper = LineClipper(self.coords)
+
+        self.text_cache = TextCache() if text_cache else None
+        self.text_mode = text_mode
+        self.text_counts = defaultdict(int)
+
+        self.write_threads = write_threads
+        self.writer = None
+
+        self.skip_unchanged = skip_unchanged
+        self.manifests = {}
 
     def add_styles(self, styles: dict):
         add_styles(styles)
@@ -100,6 +178,7 @@ class Plotter:
 
     def reset_ax_main(self) -> None:
         self.ax_main.clear()
+        self.overlays.reset()
         self.ax_main.axis(False)
         self.ax_main.set_aspect("equal")
 
@@ -111,29 +190,179 @@ class Plotter:
         self.ax_footer.clear()
         self.ax_footer.axis(False)
 
-    def set_ax_main_bounds(self, bounds):
-        vmin = bounds.vertices[0]
-        vmax = bounds.vertices[2]
+    def set_ax_main_bounds(self, bounds: ViewBox):
+        """restore the main axes to the bounds
 
-        self.ax_main.set_xlim(float(vmin.x.evalf()), float(vmax.x.evalf()))
-        self.ax_main.set_ylim(float(vmin.y.evalf()), float(vmax.y.evalf()))
-        # TODO: not sure if this should be here
-        self.ax_main.invert_yaxis()
+        a sympy bounds polygon is still accepted but converted on each call
+        """
+        if not isinstance(bounds, ViewBox):
+            bounds = ViewBox.from_polygon(bounds)
+        bounds.apply(self.ax_main)
+
+    def get_view_limits(self) -> ViewBox:
+        """return the current limits of the main axes"""
+        xmin, xmax = sorted(self.ax_main.get_xlim())
+        ymin, ymax = sorted(self.ax_main.get_ylim())
+        return ViewBox(xmin, xmax, ymin, ymax)
+
+    def clip_line(self, line: spg.Line) -> tuple[list, list]:
+        """return ``xs, ys`` of the line clipped to the current view"""
+        return self.clipper.clip(line, self.get_view_limits())
+
+    def clip_model_lines(self) -> None:
+        """clip every line of the loaded model to the current view in one pass"""
+        if self.numeric is not None:
+            self.clipper.clip_all(
+                self.numeric.elements["lines"],
+                self.numeric.lines,
+                self.get_view_limits(),
+            )
+
+    def add_text(
+        self,
+        ax,
+        x: float,
+        y: float,
+        text: str,
+        fontdict: dict,
+        ha: str = "left",
+        va: str = "baseline",
+    ):
+        """
+        add text at axes coordinates - drawn from the :attr:`text_cache` when
+        it is enabled and the string can be cached
+        """
+        text = str(text)
+        usetex = self.text_usetex(text)
+        if self.text_cache is not None and text and TextCache.supports(text):
+            artist = CachedText(
+                self.text_cache,
+                text,
+                (x, y),
+                ax.transAxes,
+                self.fig,
+                size=float(fontdict["size"]),
+                color=fontdict["color"],
+                ha=ha,
+                va=va,
+                usetex=usetex,
+                clip_on=False,
+            )
+            ax.add_artist(artist)
+            return artist
+        return ax.text(x, y, text, ha=ha, va=va, fontdict=fontdict, usetex=usetex)
 
     def annotate_point(self, point: spg.Point, text):
         """Annotate the given point with the provided text on the given axes."""
-        x = point.x.evalf()
-        y = point.y.evalf()
+        x, y = self.coords.point(point)
         styles = {
             "fontsize": 12,
             "xytext": (8, 8),
             "textcoords": "offset points",
+            "usetex": self.text_usetex(text),
         }
+        if self.text_cache is not None and text and TextCache.supports(text):
+            artist = CachedText(
+                self.text_cache,
+                text,
+                (x, y),
+                self.ax_main.transData,
+                self.fig,
+                size=styles["fontsize"],
+                color=plt.rcParams["text.color"],
+                offset=styles["xytext"],
+                usetex=styles["usetex"],
+            )
+            self.ax_main.add_artist(artist)
+            return [artist]
         return [self.ax_main.annotate(text, (x, y), **styles)]
 
+    def _needs_usetex(self, text: str) -> bool:
+        if self.text_mode == "usetex":
+            return True
+        if self.text_mode == "mathtext":
+            return False
+        return not mathtext_supported(str(text))
+
+    def text_usetex(self, text: str) -> bool:
+        """decide if a string is rendered with latex for the text mode and
+        count the path it takes"""
+        usetex = self._needs_usetex(text)
+        self.text_counts["usetex" if usetex else "mathtext"] += 1
+        return usetex
+
+    def text_report(self) -> dict:
+        """return the number of strings drawn with usetex and mathtext"""
+        return {
+            "usetex": self.text_counts["usetex"],
+            "mathtext": self.text_counts["mathtext"],
+        }
+
+    def model_texts(self, model: Model) -> list[tuple[str, float]]:
+        """return ``(text, size)`` for the header, labels, indexes and
+        descriptions drawn for the model"""
+        labels = [details.label for details in model.values()]
+        texts = [(model.name, 20)]
+        texts += [(label, 12) for label in labels]
+        texts += [(label, 24) for label in labels]
+        texts += [(f"{i:03}", 24) for i in range(len(model))]
+        texts += [(describe(el), 20) for el in model]
+        return texts
+
+    def prewarm_text(self, model: Model) -> None:
+        """
+        build the cached glyph paths for the header, labels, indexes and
+        descriptions of the model before the first frame
+        """
+        if self.text_cache is None:
+            return
+        for text, size in self.model_texts(model):
+            if text and TextCache.supports(text):
+                # multiline strings are the descriptions, centred in the footer
+                ha = "center" if "\n" in text else "left"
+                self.text_cache.get_path(text, size, self._needs_usetex(text), ha)
+
+    def compile_text(
+        self, texts, extensions=["svg", "png"], workers: int = None
+    ) -> int:
+        """
+        compile every usetex string of a job in one batch before drawing
+
+        parameters
+        ----------
+        - ``texts`` : iterable of ``(text, size)``
+        - ``extensions`` : :class:`list`: formats the job saves
+        - ``workers`` : :class:`int`: parallel latex runs
+
+        strings drawn from the :attr:`text_cache` and strings in vector
+        frames are compiled at the glyph path scale, which the svg and pdf
+        backends lay usetex text out at - strings in raster frames at their
+        size and :data:`SNAPSHOT_DPI` - returns the number of latex strings
+        compiled
+        """
+        raster = any(ext.lower() in RASTER_FORMATS for ext in extensions)
+        vector = any(ext.lower() not in RASTER_FORMATS for ext in extensions)
+
+        jobs = []
+        for text, size in texts:
+            text = str(text)
+            if not text or not self._needs_usetex(text):
+                continue
+            if self.text_cache is not None and TextCache.supports(text):
+                scales = [(TextToPath.FONT_SCALE, None)]
+            else:
+                scales = []
+                if raster:
+                    scales.append((float(size), SNAPSHOT_DPI))
+                if vector:
+                    scales.append((TextToPath.FONT_SCALE, None))
+            jobs.extend((line, *scale) for line in tex_lines(text) for scale in scales)
+        return compile_tex(jobs, workers)
+
     plot_point = _plot_point
     plot_selected_points = _plot_selected_points
     plot_circle_points = _plot_circle_points
+    plot_point_layer = _plot_point_layer
 
     plot_line = _plot_line
     plot_selected_line = _plot_selected_line
@@ -148,55 +377,182 @@ class Plotter:
     plot_polygon = _plot_polygon
 
     plot_wedge = _plot_wedge
+    plot_wedges = _plot_wedges
 
     plot_element = _plot_element
+    plot_element_main = _plot_element_main
+    plot_element_overlays = _plot_element_overlays
 
-    def plot_model(self, model: Model, annotate_points=False):
-        x_limits, y_limits = model.limits()
-        x_limits, y_limits = self._add_margin_to_ax_main_limits(x_limits, y_limits)
-        x_limits, y_limits = self._pad_ax_main_limits_for_aspect_ratio(
-            x_limits, y_limits
-        )
+    def start_writer(self) -> SnapshotWriter:
+        """start a background writer for a job when ``write_threads`` is set"""
+        if self.write_threads and self.writer is None:
+            self.writer = SnapshotWriter(self.write_threads)
+        return self.writer
 
-        self.bounds = spg.Polygon(
-            spg.Point(x_limits[0], y_limits[1]),
-            spg.Point(x_limits[0], y_limits[0]),
-            spg.Point(x_limits[1], y_limits[0]),
-            spg.Point(x_limits[1], y_limits[1]),
-        )
+    def finish_writer(self, save_manifests: bool = True) -> None:
+        """wait for the frames of the job - write errors are raised here
+
+        manifests are saved after the writer is done, without the frames that
+        failed
+        """
+        writer, self.writer = self.writer, None
+        try:
+            if writer is not None:
+                writer.close()
+        except SnapshotError as error:
+            for filename, _ in error.errors:
+                self.manifest(os.path.dirname(filename)).forget(filename)
+            raise
+        finally:
+            if save_manifests:
+                self.save_manifests()
+
+    def manifest(self, folder: str) -> FrameManifest:
+        """return the manifest of a frame folder, loading it on first use"""
+        folder = os.path.abspath(folder)
+        if folder not in self.manifests:
+            self.manifests[folder] = FrameManifest(folder)
+        return self.manifests[folder]
+
+    def manifest_changes(self) -> dict:
+        """return folder to the hashes recorded since each manifest loaded"""
+        return {
+            folder: dict(manifest.changes)
+            for folder, manifest in self.manifests.items()
+            if manifest.changes
+        }
+
+    def save_manifests(self) -> None:
+        for manifest in self.manifests.values():
+            manifest.save()
+
+    def snapshot(
+        self, folder: str, basename: str, extensions=["svg", "png"], transparent=False
+    ) -> list:
+        """
+        save the figure as ``basename`` with every extension in ``folder``
+
+        the figure is drawn once for all raster formats and once for each
+        vector format - frames go to the :attr:`writer` when one is running
+
+        with ``skip_unchanged`` set, extensions whose file was saved from the
+        same inputs are not drawn again - see :class:`FrameManifest`
+
+        returns the filenames in extension order
+        """
+        if not self.skip_unchanged:
+            return self._save_frame(folder, basename, extensions, transparent)
+
+        manifest = self.manifest(folder)
+        dpi = self.writer.dpi if self.writer is not None else SNAPSHOT_DPI
+        digest = frame_digest(self.fig, dpi, transparent)
+
+        filenames = {}
+        for ext in extensions:
+            filename = os.path.join(manifest.folder, f"{basename}.{ext}")
+            if manifest.unchanged(filename, digest):
+                print_log(f"    = {filename}")
+                filenames[ext] = filename
+
+        changed = [ext for ext in extensions if ext not in filenames]
+        if changed:
+            saved = self._save_frame(folder, basename, changed, transparent)
+            for ext, filename in zip(changed, saved):
+                manifest.record(filename, digest)
+                filenames[ext] = filename
+
+        return [filenames[ext] for ext in extensions]
+
+    def _save_frame(
+        self, folder: str, basename: str, extensions: list, transparent=False
+    ) -> list:
+        if self.writer is not None:
+            return self.writer.save_frame(
+                folder, basename, extensions, transparent, fig=self.fig
+            )
+        return save_frame(folder, basename, extensions, transparent, fig=self.fig)
+
+    def open_description_store(self, path: str = None) -> DescriptionStore:
+        """
+        persist descriptions in a sqlite file so re-runs skip the symbolic
+        work - defaults to ``descriptions.sqlite`` in the plot folder
+        """
+        if path is None:
+            path = f"./{self.plot_name}/descriptions.sqlite"
+        path = os.path.abspath(path)
+        if describe.store is None or describe.store.path != path:
+            if describe.store is not None:
+                describe.store.close()
+            describe.store = DescriptionStore(path)
+        return describe.store
+
+    def load_model(self, model: Model) -> NumericModel:
+        """
+        compile the model to its numeric mirror and seed the coordinate cache
+        so the draw path reads floats only
+
+        loading the same model again only compiles elements added since
+        """
+        if self.numeric is not None and self.numeric.model is model:
+            self.numeric.update()
+        else:
+            self.numeric = NumericModel(model, self.coords)
+        return self.numeric
+
+    def plot_model(self, model: Model, annotate_points=False, batched=False):
+        """
+        plot every element of the model
+
+        with ``batched`` the elements are grouped on their styles and drawn as
+        one collection per group - :attr:`batches` maps each element to its
+        ``(artist, index)``
+        """
+        numeric = self.load_model(model)
+        self.bounds = self.get_view_box(*numeric.limits())
         self.set_ax_main_bounds(self.bounds)
+        self.clip_model_lines()
 
         self.plot_header(model.name)
 
         self.cursor_points = {}
 
-        for i, (el, details) in enumerate(model.items()):
-            if isinstance(el, spg.Point):
-                pt_inner, *pts = self.plot_point(
-                    el, details.label, details.classes, 
-                )
-                details.pt = el
-                self.cursor_points[pt_inner] = details
-                if annotate_points:
+        if batched:
+            self.batches, self.cursor_points = _plot_batched(self, numeric)
+            if annotate_points:
+                points = zip(numeric.elements["points"], numeric.details["points"])
+                for el, details in points:
                     self.annotate_point(el, details.label)
+        else:
+            for i, (el, details) in enumerate(model.items()):
+                if isinstance(el, spg.Point):
+                    pt_inner, *pts = self.plot_point(
+                        el, details.label, details.classes, 
+                    )
+                    details.pt = el
+                    self.cursor_points[pt_inner] = details
+                    if annotate_points:
+                        self.annotate_point(el, details.label)
 
-            if isinstance(el, spg.Line):
-                self.plot_line(el, details.classes)
+                if isinstance(el, spg.Line):
+                    self.plot_line(el, details.classes)
 
-            if isinstance(el, spg.Circle):
-                self.plot_circle(el, details.classes)
+                if isinstance(el, spg.Circle):
+                    self.plot_circle(el, details.classes)
 
-            if isinstance(el, spg.Segment):
-                self.plot_segment(el, details.classes)
+                if isinstance(el, spg.Segment):
+                    self.plot_segment(el, classes=details.classes)
 
-            if isinstance(el, spg.Polygon):
-                self.plot_polygon([el], details.classes)
+                if isinstance(el, spg.Polygon):
+                    self.plot_polygon([el], details.classes)
 
-            if isinstance(el, Wedge):
-                self.plot_wedge(el, details.classes)
+                if isinstance(el, Wedge):
+                    self.plot_wedge(el, details.classes)
 
         def _on_add(sel):
             details = self.cursor_points[sel.artist]
+            if isinstance(details, list):
+                # batched marker artists hold the details of each point
+                details = details[int(sel.index)]
 
             xval = sp.latex(details.pt.x)
             yval = sp.latex(details.pt.y)
@@ -217,7 +573,8 @@ class Plotter:
         """
         self.reset_ax_header()
 
-        artist = self.ax_header.text(
+        artist = self.add_text(
+            self.ax_header,
             0.5,
             0.5,
             text,
@@ -234,10 +591,17 @@ class Plotter:
         
         #  self.reset_ax_footer()
 
-        index_artist = self.ax_footer.text(
-            0, 0.5, index, ha="left", va="center", fontdict={"color": "r", "size": "24"}
+        index_artist = self.add_text(
+            self.ax_footer,
+            0,
+            0.5,
+            index,
+            ha="left",
+            va="center",
+            fontdict={"color": "r", "size": "24"},
         )
-        description_artist = self.ax_footer.text(
+        description_artist = self.add_text(
+            self.ax_footer,
             0.5,
             0.5,
             description,
@@ -247,7 +611,8 @@ class Plotter:
         )
         #  if label:
         #  label = f"${label}$"
-        label_artist = self.ax_footer.text(
+        label_artist = self.add_text(
+            self.ax_footer,
             1,
             0.5,
             label,
@@ -258,83 +623,47 @@ class Plotter:
 
         return [index_artist, description_artist, label_artist]
 
+    @property
+    def ax_main_ratio(self) -> float:
+        """width to height ratio of the main axes"""
+        # TODO: the height proportion of 10/12 should be set when
+        # configuring the axes.
+        return self.FIG_W / (self.FIG_H * (10 / 12))
+
+    def get_view_box(self, x_limits: list, y_limits: list) -> ViewBox:
+        """return the limits with margin and padded to the main axes ratio"""
+        view_box = ViewBox.from_limits(x_limits, y_limits)
+        view_box = view_box.with_margin(self.margin_ratio)
+        return view_box.padded_to_aspect(self.ax_main_ratio)
+
     def _add_margin_to_ax_main_limits(
         self, x_limits: list, y_limits: list, default_margin=0.5
     ):
-        x_range = x_limits[1] - x_limits[0]
-        y_range = y_limits[1] - y_limits[0]
-
-        if x_range:
-            x_margin = x_range * self.margin_ratio
-            if y_range:
-                y_margin = y_range * self.margin_ratio
-            else:
-                y_margin = x_margin
-        else:
-            if y_range:
-                y_margin = y_range * self.margin_ratio
-                x_margin = y_margin
-            else:
-                x_margin = default_margin
-                y_margin = default_margin
-
-        x_limits[0] -= x_margin
-        x_limits[1] += x_margin
-
-        y_limits[0] -= y_margin
-        y_limits[1] += y_margin
-
-        return x_limits, y_limits
+        view_box = ViewBox.from_limits(x_limits, y_limits)
+        view_box = view_box.with_margin(self.margin_ratio, default_margin)
+        return view_box.x_limits, view_box.y_limits
 
     def _pad_ax_main_limits_for_aspect_ratio(self, x_limits: list, y_limits: list):
-        current_width = x_limits[1] - x_limits[0]
-        current_height = y_limits[1] - y_limits[0]
-
-        current_ratio = current_width / current_height
-        # TODO: the height proportion of 10/12 should be set when
-        # configuring the axes.
-        ax_main_ratio = self.FIG_W / (self.FIG_H * (10 / 12))
-
-        if current_ratio < ax_main_ratio:
-            # Increase width
-            extra_width = (current_height * ax_main_ratio) - current_width
-            x_limits[0] -= extra_width / 2
-            x_limits[1] += extra_width / 2
-        elif current_ratio > ax_main_ratio:
-            # Increase height
-            extra_height = (current_width / ax_main_ratio) - current_height
-            y_limits[0] -= extra_height / 2
-            y_limits[1] += extra_height / 2
-
-        return x_limits, y_limits
+        view_box = ViewBox.from_limits(x_limits, y_limits)
+        view_box = view_box.padded_to_aspect(self.ax_main_ratio)
+        return view_box.x_limits, view_box.y_limits
 
     def set_plotter_limits_from_points(self, points):
         # TODO: this should not change the self.bounds - especially if used for zoom
-        x_limits, y_limits = get_limits_from_points(points)
-        x_limits, y_limits = self._add_margin_to_ax_main_limits(x_limits, y_limits)
-        x_limits, y_limits = self._pad_ax_main_limits_for_aspect_ratio(
-            x_limits, y_limits
-        )
-
-        self.bounds = spg.Polygon(
-            spg.Point(x_limits[0], y_limits[1]),
-            spg.Point(x_limits[0], y_limits[0]),
-            spg.Point(x_limits[1], y_limits[0]),
-            spg.Point(x_limits[1], y_limits[1]),
-        )
+        x_limits, y_limits = get_limits_from_points(points, self.coords)
+        self.bounds = self.get_view_box(x_limits, y_limits)
         self.set_ax_main_bounds(self.bounds)
 
-
     def zoom_to_points(self, zoom_pts):
         if zoom_pts:
-            x_limits, y_limits = get_limits_from_points(zoom_pts)
-            x_limits, y_limits = self._add_margin_to_ax_main_limits(x_limits, y_limits)
-            x_limits, y_limits = self._pad_ax_main_limits_for_aspect_ratio(
-            x_limits, y_limits
-            )
-
-            self.ax_main.set_xlim(x_limits[0], x_limits[1])
-            self.ax_main.set_ylim(y_limits[0], y_limits[1])
+            x_limits, y_limits = get_limits_from_points(zoom_pts, self.coords)
+            self.get_view_box(x_limits, y_limits).apply(self.ax_main)
+
+    def invalidate_coords(self, element=None):
+        """clear cached float coordinates after the model changes"""
+        self.coords.invalidate(element)
+        self.clipper.invalidate()
+        self.numeric = None
 
     def zoom_to_bounds(self):
         self.set_ax_main_bounds(self.bounds)
@@ -0,0 +1,196 @@
+"""
+batched rendering of a whole model
+
+one artist per element makes draw time and memory grow with the model - here
+elements are grouped on their resolved styles and each group is drawn as a
+single collection or marker artist
+
+- lines and segments -> :class:`matplotlib.collections.LineCollection`
+- circles and wedges -> :class:`matplotlib.collections.PatchCollection`
+- polygons -> :class:`matplotlib.collections.PolyCollection`
+- points -> a :class:`PointLayer`
+
+elements within a group are drawn in model order, but groups with the same
+zorder are drawn group by group
+"""
+# permits forward reference for Plotter class
+from __future__ import annotations
+
+from ..common import *
+from ..styles import *
+
+from matplotlib.collections import LineCollection, PatchCollection, PolyCollection
+
+from ._clip import clip_lines
+from ._numeric import NumericModel
+from ._points import PointLayer, _style_key
+from ._wedges import wedge_params
+
+# Line2D style keys and their collection equivalents - marker keys are drawn
+# by a separate marker artist
+_LINE_KEYS = {
+    "color": "colors",
+    "linestyle": "linestyles",
+    "linewidth": "linewidths",
+    "solid_capstyle": "capstyle",
+    "zorder": "zorder",
+}
+_PATCH_KEYS = ("edgecolor", "facecolor", "linestyle", "linewidth", "zorder")
+
+
+class BatchIndex:
+    """
+    maps elements to the batched artists that draw them and back
+
+    each artist keeps its elements in draw order, so the index of an item in
+    a collection - or a vertex of a marker artist - is its position in
+    :meth:`elements`
+
+    :attr:`points` holds the :class:`PointLayer` of the model points, to
+    change their visibility
+    """
+
+    def __init__(self):
+        self._artists = defaultdict(list)
+        self._elements = {}
+        self.points = None
+
+    def add(self, artist, elements: list) -> None:
+        self._elements[artist] = list(elements)
+        for index, element in enumerate(elements):
+            self._artists[element].append((artist, index))
+
+    def artists(self, element) -> list[tuple]:
+        """return ``(artist, index)`` for every artist drawing the element"""
+        return self._artists.get(element, [])
+
+    def element(self, artist, index: int):
+        """return the element drawn at ``index`` of an artist"""
+        return self._elements[artist][int(index)]
+
+    def elements(self, artist) -> list:
+        return self._elements[artist]
+
+    def __contains__(self, artist) -> bool:
+        return artist in self._elements
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+
+def _group(element_type: str, details_list: list) -> dict:
+    """return resolved styles to row indexes, in first seen order"""
+    groups = {}
+    for row in range(len(details_list)):
+        styles = get_styles(element_type, details_list[row].classes)
+        key = _style_key(styles)
+        if key not in groups:
+            groups[key] = (styles, [])
+        groups[key][1].append(row)
+    return groups
+
+
+def _line_kwargs(styles: dict) -> dict:
+    return {_LINE_KEYS[key]: value for key, value in styles.items() if key in _LINE_KEYS}
+
+
+def _marker_kwargs(styles: dict) -> dict:
+    kwargs = {
+        key: value
+        for key, value in styles.items()
+        if key.startswith("marker") or key in ("color", "fillstyle", "zorder")
+    }
+    kwargs["linestyle"] = ""
+    return kwargs
+
+
+def _patch_kwargs(styles: dict) -> dict:
+    kwargs = {key: styles[key] for key in _PATCH_KEYS if key in styles}
+    if "color" in styles:
+        kwargs.setdefault("edgecolor", styles["color"])
+        kwargs.setdefault("facecolor", styles["color"])
+    if not styles.get("fill", True):
+        kwargs["facecolor"] = "none"
+    return kwargs
+
+
+def _plot_batched(plotter: Plotter, numeric: NumericModel) -> tuple[BatchIndex, dict]:
+    """
+    draw every element of the numeric model with batched artists
+
+    returns the :class:`BatchIndex` of the new artists and a dict of point
+    marker artists to the details of each point, for hover cursors
+    """
+    ax = plotter.ax_main
+    batches = BatchIndex()
+    cursor_points = {}
+
+    # points
+    elements = numeric.elements["points"]
+    details_list = numeric.details["points"]
+    classes_list = [details.classes for details in details_list]
+    points = PointLayer(ax, numeric.points, classes_list)
+    batches.points = points
+    for layer, artist, rows in points.artists:
+        batches.add(artist, [elements[row] for row in rows])
+        if layer == "point_outer":
+            for row in rows:
+                details_list[row].pt = elements[row]
+            cursor_points[artist] = [details_list[row] for row in rows]
+
+    # lines - rows that miss the view are nan and draw nothing
+    elements = numeric.elements["lines"]
+    ends = clip_lines(numeric.lines, plotter.get_view_limits())
+    for styles, rows in _group("line", numeric.details["lines"]).values():
+        collection = LineCollection(
+            ends[rows].reshape(-1, 2, 2), **_line_kwargs(styles)
+        )
+        ax.add_collection(collection, autolim=False)
+        batches.add(collection, [elements[row] for row in rows])
+
+    # segments - the end markers are a separate artist
+    elements = numeric.elements["segments"]
+    for styles, rows in _group("segment", numeric.details["segments"]).values():
+        segments = numeric.segments[rows].reshape(-1, 2, 2)
+        collection = LineCollection(segments, **_line_kwargs(styles))
+        ax.add_collection(collection, autolim=False)
+        batches.add(collection, [elements[row] for row in rows])
+        if styles.get("marker"):
+            ends = segments.reshape(-1, 2)
+            artist = ax.plot(ends[:, 0], ends[:, 1], **_marker_kwargs(styles))[0]
+            batches.add(artist, [elements[row] for row in rows for _ in range(2)])
+
+    # circles
+    elements = numeric.elements["circles"]
+    for styles, rows in _group("circle", numeric.details["circles"]).values():
+        patches = [
+            mp.patches.Circle((cx, cy), r) for cx, cy, r in numeric.circles[rows].tolist()
+        ]
+        collection = PatchCollection(patches, **_patch_kwargs(styles))
+        ax.add_collection(collection, autolim=False)
+        batches.add(collection, [elements[row] for row in rows])
+
+    # polygons
+    elements = numeric.elements["polygons"]
+    for styles, rows in _group("polygon", numeric.details["polygons"]).values():
+        verts = [numeric.polygon(row) for row in rows]
+        collection = PolyCollection(verts, **_patch_kwargs(styles))
+        ax.add_collection(collection, autolim=False)
+        batches.add(collection, [elements[row] for row in rows])
+
+    # wedges
+    elements = numeric.elements["wedges"]
+    for styles, rows in _group("wedge", numeric.details["wedges"]).values():
+        wedges = [elements[row] for row in rows]
+        centers, radii, theta1, theta2 = wedge_params(plotter, wedges)
+        patches = [
+            mp.patches.Wedge(center, radius, a1, a2)
+            for center, radius, a1, a2 in zip(
+                centers.tolist(), radii.tolist(), theta1.tolist(), theta2.tolist()
+            )
+        ]
+        collection = PatchCollection(patches, **_patch_kwargs(styles))
+        ax.add_collection(collection, autolim=False)
+        batches.add(collection, wedges)
+
+    return batches, cursor_points
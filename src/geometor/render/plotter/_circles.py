@@ -17,8 +17,8 @@ def _plot_circle(
     if classes is None:
         classes = []
 
-    center = (circle.center.x.evalf(), circle.center.y.evalf())
-    radius = circle.radius
+    cx, cy, radius = plotter.coords.circle(circle)
+    center = (cx, cy)
 
     styles = get_styles("circle", classes)
     patch = plt.Circle(center, radius, **styles)
@@ -35,8 +35,8 @@ def _plot_selected_circle(
     if classes is None:
         classes = []
 
-    center = (circle.center.x.evalf(), circle.center.y.evalf())
-    radius = circle.radius
+    cx, cy, radius = plotter.coords.circle(circle)
+    center = (cx, cy)
 
     styles = get_styles("circle", classes)
     styles.update(get_styles("circle_selected", classes))
@@ -0,0 +1,99 @@
+"""
+float line clipping for the plotter
+
+lines are infinite, so they are clipped to the view before plotting - this
+replaces the symbolic ``Polygon.intersection`` with a vectorized
+Liang-Barsky clip over ``ax + by + c = 0`` coefficient rows
+"""
+# permits forward reference for Plotter class
+from __future__ import annotations
+
+from ..common import *
+
+from ._coords import CoordCache
+
+
+def clip_lines(coeffs: np.ndarray, limits: tuple) -> np.ndarray:
+    """
+    clip lines to a box in one numpy pass
+
+    parameters
+    ----------
+    - ``coeffs`` : ``(N, 3)`` array of ``a, b, c`` for ``ax + by + c = 0``
+    - ``limits`` : ``(xmin, xmax, ymin, ymax)``
+
+    returns
+    -------
+    ``(N, 4)`` array of ``x1, y1, x2, y2`` - rows for lines that miss the box
+    are ``nan``
+    """
+    coeffs = np.asarray(coeffs, dtype=np.float64).reshape(-1, 3)
+    xmin, xmax, ymin, ymax = limits
+    a, b, c = coeffs.T
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        norm = a * a + b * b
+        # closest point to the origin and direction along the line
+        x0 = -a * c / norm
+        y0 = -b * c / norm
+        dx = b
+        dy = -a
+
+        p = np.stack([-dx, dx, -dy, dy])
+        q = np.stack([x0 - xmin, xmax - x0, y0 - ymin, ymax - y0])
+        t = q / p
+
+        t0 = np.where(p < 0, t, -np.inf).max(axis=0)
+        t1 = np.where(p > 0, t, np.inf).min(axis=0)
+        parallel_outside = ((p == 0) & (q < 0)).any(axis=0)
+
+    visible = (norm > 0) & ~parallel_outside & (t0 <= t1)
+
+    ends = np.full((len(coeffs), 4), np.nan)
+    ends[visible, 0] = x0[visible] + t0[visible] * dx[visible]
+    ends[visible, 1] = y0[visible] + t0[visible] * dy[visible]
+    ends[visible, 2] = x0[visible] + t1[visible] * dx[visible]
+    ends[visible, 3] = y0[visible] + t1[visible] * dy[visible]
+    return ends
+
+
+def line_coeffs(x1: float, y1: float, x2: float, y2: float) -> tuple:
+    """return ``a, b, c`` for the line through two points"""
+    return (y1 - y2, x2 - x1, x1 * y2 - x2 * y1)
+
+
+class LineClipper:
+    """
+    caches clipped line ends per ``(line, limits)``
+
+    zoom frames and selected overlays clip the same lines to the same view
+    again and again - the result is computed once and reused
+    """
+
+    def __init__(self, coords: CoordCache):
+        self.coords = coords
+        self._cache = {}
+
+    def clip(self, line: spg.Line, limits: tuple) -> tuple[list, list]:
+        """return ``xs, ys`` of the line clipped to ``limits``"""
+        key = (line, limits)
+        try:
+            return self._cache[key]
+        except KeyError:
+            coeffs = [line_coeffs(*self.coords.line(line))]
+            self.clip_all([line], coeffs, limits)
+            return self._cache[key]
+
+    def clip_all(self, lines: list, coeffs: np.ndarray, limits: tuple) -> None:
+        """clip a batch of lines in one call and cache the results"""
+        if not len(lines):
+            return
+        ends = clip_lines(coeffs, limits)
+        for line, (x1, y1, x2, y2) in zip(lines, ends.tolist()):
+            if np.isnan(x1):
+                self._cache[(line, limits)] = ([], [])
+            else:
+                self._cache[(line, limits)] = ([x1, x2], [y1, y2])
+
+    def invalidate(self) -> None:
+        self._cache.clear()
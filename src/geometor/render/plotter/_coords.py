@@ -0,0 +1,137 @@
+"""
+float coordinate cache for the plotter functions
+
+sympy evaluation of nested radicals is the expensive part of rendering, so
+each element is converted to python floats once and reused by every
+``plotter/_*.py`` function for the rest of the run.
+"""
+# permits forward reference for Plotter class
+from __future__ import annotations
+
+from ..common import *
+
+from geometor.model import Wedge
+
+
+class CoordCache:
+    """
+    caches float coordinates for sympy elements, keyed on the element
+
+    - points map to ``(x, y)``
+    - lines and segments map to their endpoints ``(x1, y1, x2, y2)``
+    - circles map to ``(cx, cy, r)``
+
+    the cache is not aware of changes to the model - call
+    :meth:`invalidate` when elements are removed or replaced
+    """
+
+    def __init__(self):
+        self._cache = {}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __contains__(self, element) -> bool:
+        return element in self._cache
+
+    def point(self, pt: spg.Point) -> tuple[float, float]:
+        """return the ``(x, y)`` floats for a point"""
+        try:
+            return self._cache[pt]
+        except KeyError:
+            xy = (float(pt.x.evalf()), float(pt.y.evalf()))
+            self._cache[pt] = xy
+            return xy
+
+    def points(self, pts: list[spg.Point]) -> tuple[list, list]:
+        """return separate lists of x and y floats for a list of points"""
+        xs = []
+        ys = []
+        for pt in pts:
+            x, y = self.point(pt)
+            xs.append(x)
+            ys.append(y)
+        return xs, ys
+
+    def line(self, line: spg.LinearEntity) -> tuple[float, float, float, float]:
+        """return the ``(x1, y1, x2, y2)`` floats for the defining points of
+        a line or segment"""
+        try:
+            return self._cache[line]
+        except KeyError:
+            x1, y1 = self.point(line.p1)
+            x2, y2 = self.point(line.p2)
+            ends = (x1, y1, x2, y2)
+            self._cache[line] = ends
+            return ends
+
+    def circle(self, circle: spg.Circle) -> tuple[float, float, float]:
+        """return the ``(cx, cy, r)`` floats for a circle"""
+        try:
+            return self._cache[circle]
+        except KeyError:
+            cx, cy = self.point(circle.center)
+            values = (cx, cy, float(circle.radius.evalf()))
+            self._cache[circle] = values
+            return values
+
+    def evaluate(self, element):
+        """evaluate any plotted element and return its floats
+
+        - points, lines, segments and circles return their cache entry
+        - polygons return a tuple of vertex ``(x, y)``
+        - wedges return the circle entry and the start and end point
+
+        the result is plain floats, so it can be sent between processes and
+        restored with :meth:`seed`
+        """
+        if isinstance(element, spg.Point):
+            return self.point(element)
+        if isinstance(element, (spg.Line, spg.Segment)):
+            return self.line(element)
+        if isinstance(element, spg.Circle):
+            return self.circle(element)
+        if isinstance(element, spg.Polygon):
+            return tuple(self.point(pt) for pt in element.vertices)
+        if isinstance(element, Wedge):
+            return (
+                self.circle(element.circle),
+                self.point(element.start_point),
+                self.point(element.end_point),
+            )
+        return None
+
+    def seed(self, element, values) -> None:
+        """store the result of :meth:`evaluate` for the element and the
+        points it was evaluated from"""
+        if values is None:
+            return
+        if isinstance(element, spg.Point):
+            self._cache[element] = values
+        elif isinstance(element, (spg.Line, spg.Segment)):
+            self._cache[element] = values
+            self._cache.setdefault(element.p1, values[0:2])
+            self._cache.setdefault(element.p2, values[2:4])
+        elif isinstance(element, spg.Circle):
+            self._cache[element] = values
+            self._cache.setdefault(element.center, values[0:2])
+        elif isinstance(element, spg.Polygon):
+            for pt, xy in zip(element.vertices, values):
+                self._cache.setdefault(pt, xy)
+        elif isinstance(element, Wedge):
+            circle_values, start, end = values
+            self.seed(element.circle, circle_values)
+            self._cache.setdefault(element.start_point, start)
+            self._cache.setdefault(element.end_point, end)
+
+    def invalidate(self, element=None) -> None:
+        """drop a single element from the cache or clear it entirely
+
+        circles and lines also hold references to their defining points, so
+        invalidating a point does not invalidate elements built on it - clear
+        the whole cache if the model changed in structure
+        """
+        if element is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(element, None)
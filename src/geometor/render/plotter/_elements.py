@@ -15,59 +15,225 @@ from ._segments import _plot_segment, _plot_line_segment, _plot_circle_radius
 from ._polygons import _plot_polygon
 from ._wedges import _plot_wedge, Wedge
 
+from ..descriptions import describe
+from ..utils import ViewBox, get_limits_from_points
+
+
+LAYERS = ("main", "selected", "annotation", "footer")
+
+
+# released slots a layer may hold before it is compacted
+COMPACT_MIN_FREE = 1024
+
+
+class ArtistView(tuple):
+    """
+    read-only artists of one layer of a :class:`PlotElement`
+
+    a snapshot of the registry range - changing it would not change the
+    element, so the list methods raise instead of silently doing nothing
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            "PlotElement artists are read-only views - "
+            "use PlotElement.add_artists(layer, artists)"
+        )
+
+    append = extend = insert = remove = pop = clear = _read_only
+    __setitem__ = __delitem__ = __iadd__ = _read_only
+
+
+class ArtistRegistry:
+    """
+    shared artist lists for each layer of every :class:`PlotElement`
+
+    elements keep ``(start, stop)`` ranges into these lists instead of lists
+    of their own - removed artists leave ``None`` in their slots until more
+    than half of a layer is free, then the layer is compacted and the ranges
+    of its elements are moved
+    """
+
+    def __init__(self):
+        self.layers = {layer: [] for layer in LAYERS}
+        self._owners = {layer: {} for layer in LAYERS}
+        self._free = dict.fromkeys(LAYERS, 0)
+
+    def add(
+        self, layer: str, artists: list, owner: PlotElement = None
+    ) -> tuple[int, int]:
+        """append artists to a layer and return their range - the range of
+        ``owner`` is updated when the layer is compacted"""
+        artist_list = self.layers[layer]
+        start = len(artist_list)
+        artist_list.extend(artists)
+        if owner is not None:
+            self._owners[layer][start] = owner
+        return start, len(artist_list)
+
+    def get(self, layer: str, start: int, stop: int) -> list:
+        return [
+            artist for artist in self.layers[layer][start:stop] if artist is not None
+        ]
+
+    def release(self, layer: str, start: int, stop: int) -> None:
+        if stop <= start:
+            return
+        artist_list = self.layers[layer]
+        for i in range(start, stop):
+            artist_list[i] = None
+        self._owners[layer].pop(start, None)
+        self._free[layer] += stop - start
+        free = self._free[layer]
+        if free > COMPACT_MIN_FREE and 2 * free > len(artist_list):
+            self.compact(layer)
+
+    def compact(self, layer: str) -> None:
+        """drop the released slots of a layer and move the ranges of its
+        elements"""
+        artist_list = self.layers[layer]
+        compacted = []
+        owners = {}
+        for _, owner in sorted(self._owners[layer].items()):
+            start, stop = owner._range(layer)
+            new_start = len(compacted)
+            compacted.extend(artist_list[start:stop])
+            owner._set_range(layer, new_start, len(compacted))
+            owners[new_start] = owner
+        self.layers[layer] = compacted
+        self._owners[layer] = owners
+        self._free[layer] = 0
+
 
 class PlotElement:
     """
     The PlotElement class contains the matplotlib artists for rendering
     a geometric element in matplotlib
 
+    artists are held in an :class:`ArtistRegistry` shared by all elements of
+    a plotter - each element only stores a ``(start, stop)`` range per layer
+    and its zoom extents as a :class:`ViewBox` of four floats
     """
 
+    __slots__ = (
+        "registry",
+        "index",
+        "element",
+        "label",
+        "description",
+        "zoom",
+        "_ranges",
+    )
+
     def __init__(
         self,
-        main_artists: list = None,
-        selected_artists: list = None,
-        annotation_artists: list = None,
+        registry: ArtistRegistry = None,
+        index: int = None,
+        element=None,
     ):
-        if isinstance(main_artists, list):
-            self.main_artists = main_artists
-        else:
-            if main_artists:
-                self.main_artists = [main_artists]
-            else:
-                self.main_artists = []
-
-        self.selected_artists = selected_artists if selected_artists else []
-        self.annotation_artists = annotation_artists if annotation_artists else []
-        self.related_elements = []
-        self.parent_elements = []
-        self.footer_artists = []
+        if registry is not None and not isinstance(registry, ArtistRegistry):
+            raise TypeError(
+                "PlotElement takes an ArtistRegistry, not a list of artists - "
+                "use PlotElement(registry, index, element) and add_artists"
+            )
+        self.registry = registry if registry is not None else ArtistRegistry()
+        self.index = index
+        self.element = element
         self.label = None
         self.description = None
-        self.zoom_pts = []
+        self.zoom = None
+        self._ranges = (0, 0) * len(LAYERS)
+
+    def _range(self, layer: str) -> tuple[int, int]:
+        i = 2 * LAYERS.index(layer)
+        return self._ranges[i], self._ranges[i + 1]
+
+    def _set_range(self, layer: str, start: int, stop: int) -> None:
+        i = 2 * LAYERS.index(layer)
+        ranges = list(self._ranges)
+        ranges[i : i + 2] = start, stop
+        self._ranges = tuple(ranges)
+
+    def artists_of(self, layer: str) -> ArtistView:
+        return ArtistView(self.registry.get(layer, *self._range(layer)))
+
+    def add_artists(self, layer: str, artists: list) -> None:
+        """add artists to a layer - the range stays contiguous, so artists of
+        an earlier call are moved to the end when other elements were added
+        in between"""
+        if not artists:
+            return
+        start, stop = self._range(layer)
+        if start == stop:
+            self._set_range(layer, *self.registry.add(layer, artists, self))
+        elif stop == len(self.registry.layers[layer]):
+            self._set_range(layer, start, self.registry.add(layer, artists)[1])
+        else:
+            current = list(self.artists_of(layer))
+            self.registry.release(layer, start, stop)
+            self._set_range(
+                layer, *self.registry.add(layer, current + list(artists), self)
+            )
+
+    @property
+    def main_artists(self) -> ArtistView:
+        return self.artists_of("main")
+
+    @property
+    def selected_artists(self) -> ArtistView:
+        return self.artists_of("selected")
+
+    @property
+    def annotation_artists(self) -> ArtistView:
+        return self.artists_of("annotation")
+
+    @property
+    def footer_artists(self) -> ArtistView:
+        return self.artists_of("footer")
+
+    def artists(self) -> list:
+        """return the main, selected, annotation and footer artists"""
+        artists = []
+        for layer in LAYERS:
+            artists.extend(self.artists_of(layer))
+        return artists
+
+    @property
+    def has_overlays(self) -> bool:
+        start, stop = self._range("footer")
+        return stop > start
+
+    def drop_overlays(self):
+        """remove the selection, annotation and footer artists from the
+        figure - the main artists are kept"""
+        for layer in LAYERS[1:]:
+            start, stop = self._range(layer)
+            for artist in self.registry.get(layer, start, stop):
+                artist.remove()
+            self.registry.release(layer, start, stop)
+            self._set_range(layer, 0, 0)
+        self.description = None
+
+    def _set_visible(self, layers: tuple, visible: bool) -> None:
+        for layer in layers:
+            for artist in self.artists_of(layer):
+                artist.set_visible(visible)
 
     def show(self):
-        for artist in self.main_artists:
-            artist.set_visible(True)
+        self._set_visible(("main",), True)
 
     def hide(self):
-        for artist in self.main_artists:
-            artist.set_visible(False)
-        for artist in self.selected_artists:
-            artist.set_visible(False)
-        for artist in self.annotation_artists:
-            artist.set_visible(False)
-        for artist in self.footer_artists:
-            artist.set_visible(False)
+        self._set_visible(LAYERS, False)
+
+    def deselect(self):
+        """hide everything but the main artists"""
+        self._set_visible(LAYERS[1:], False)
 
     def show_footer(self):
-        for artist in self.footer_artists:
-            #  inspect(artist)
-            artist.set_visible(True)
+        self._set_visible(("footer",), True)
 
     def hide_footer(self):
-        for artist in self.footer_artists:
-            artist.set_visible(False)
+        self._set_visible(("footer",), False)
 
     def highlight(self):
         # Highlight the main artifact (you might want to change the color, style or other properties)
@@ -75,8 +241,7 @@ class PlotElement:
 
     def select(self):
         # Select the main artifact and related elements
-        for artist in self.selected_artists:
-            artist.set_visible(True)
+        self._set_visible(("selected",), True)
 
     def dim(self):
         # Dim the main artifact (you might want to reduce opacity or change other visual properties)
@@ -85,8 +250,7 @@ class PlotElement:
 
     def annotate(self):
         # Annotate the main artifact with the provided annotation
-        for artist in self.annotation_artists:
-            artist.set_visible(True)
+        self._set_visible(("annotation",), True)
 
     def set_label(self, label):
         # Set label for the main artifact
@@ -96,9 +260,16 @@ class PlotElement:
         # Set description for the main artifact
         self.description = description
 
-    def set_zoom_pts(self, points):
-        # Set zoom points for the main artifact
-        self.zoom_pts = points
+    def set_zoom_pts(self, points, coords=None):
+        # Set zoom extents for the main artifact
+        self.zoom = ViewBox.from_limits(*get_limits_from_points(points, coords))
+
+    @property
+    def zoom_pts(self) -> list:
+        """the corners of the zoom extents, for :meth:`Plotter.zoom_to_points`"""
+        if self.zoom is None:
+            return []
+        return [(self.zoom.xmin, self.zoom.ymin), (self.zoom.xmax, self.zoom.ymax)]
 
 
 def _plot_element(self, index, el, model):
@@ -106,179 +277,154 @@ def _plot_element(self, index, el, model):
     instanstiates and returns a PlotElement object
     containing all the necessary matplotlib artifacts for rendering a geometric element
     """
+    plot_element = self.plot_element_main(index, el, model)
+    self.plot_element_overlays(plot_element, model)
+
+    # TODO: selected set by caller
+    #  self.selected = selected
 
+    # TODO: draw should be done by the caller
+    #  plt.draw()
+
+    return plot_element
+
+
+def _plot_element_main(self, index, el, model):
+    """
+    returns a PlotElement with only the main artists and zoom points of the
+    element - the overlays are added by :func:`_plot_element_overlays`
+    """
     details = model[el]
 
-    #  zoom_pts = []
-    annotate_points = []
+    plot_element = PlotElement(self.artist_registry, index, el)
+    plot_element.set_label(details.label)
 
-    plot_element = PlotElement(None)
+    main_artists = []
+    zoom_pts = []
 
     if isinstance(el, spg.Point):
-        typ = "point"
-        description = (
-            f"$\\left\{{ \\ {sp.latex(el.x)}, \\ {sp.latex(el.y)} \\ \\right\}}$"
-        )
+        main_artists.extend(self.plot_point(el, details.label, details.classes))
+        zoom_pts.append(el)
 
-        #  pt_inner, *pts = self.plot_point(el, details.classes)
-        plot_element.main_artists.extend(self.plot_point(el, details.classes))
+    if isinstance(el, spg.Line):
+        main_artists.extend(self.plot_line(el, details.classes))
+        zoom_pts.extend(el.points)
 
-        annotate_points.append(el)
-        for pt in annotate_points:
-            label = model[pt].label
-            plot_element.annotation_artists.extend(self.annotate_point(pt, label))
+    if isinstance(el, spg.Circle):
+        main_artists.extend(self.plot_circle(el, details.classes))
+        cx, cy, r = self.coords.circle(el)
+        zoom_pts.append((cx - r, cy - r))
+        zoom_pts.append((cx + r, cy + r))
+
+    if isinstance(el, spg.Segment):
+        main_artists.extend(self.plot_segment(el, classes=details.classes))
+        zoom_pts.extend(el.points)
+
+    if isinstance(el, spg.Polygon):
+        main_artists.extend(self.plot_polygon([el], details.classes))
+        # TODO: refactor plot_polygons
+        zoom_pts.extend(el.vertices)
+
+    if isinstance(el, Wedge):
+        main_artists.extend(self.plot_wedge(el, details.classes))
+        zoom_pts.extend(el.points)
+
+    plot_element.add_artists("main", main_artists)
+    if zoom_pts:
+        plot_element.set_zoom_pts(zoom_pts, self.coords)
 
-        plot_element.zoom_pts.append(el)
+    return plot_element
+
+
+def _plot_element_overlays(self, plot_element, model):
+    """
+    add the selection, annotation and footer artists to a PlotElement from
+    :func:`_plot_element_main`
+    """
+    el = plot_element.element
+    details = model[el]
+
+    annotate_points = []
+    selected_artists = []
+    annotation_artists = []
+
+    if isinstance(el, spg.Point):
+        annotate_points.append(el)
 
         if "given" not in details.classes:
             for parent in list(details.parents.keys())[0:2]:
                 if isinstance(parent, spg.Line):
                     parent_classes = model[parent].classes
-                    plot_element.selected_artists.extend(
+                    selected_artists.extend(
                         self.plot_selected_line(parent, parent_classes)
                     )
                 if isinstance(parent, spg.Circle):
                     parent_classes = model[parent].classes
-                    plot_element.selected_artists.extend(
+                    selected_artists.extend(
                         self.plot_selected_circle(
                             parent,
                             parent_classes,
                         )
                     )
-        plot_element.selected_artists.extend(self.plot_selected_points([el]))
+        selected_artists.extend(self.plot_selected_points([el]))
 
     if isinstance(el, spg.Line):
-        typ = "line"
-        eq = el.equation().simplify()
-        dist = sp.sqrtdenest(el.p1.distance(el.p2).simplify())
-        description = f"${sp.latex(eq)} = 0$ \n $d = {sp.latex(dist)}$"
-
-        plot_element.main_artists.extend(self.plot_line(el, details.classes))
-
-        plot_element.zoom_pts.extend(el.points)
-
-        plot_element.selected_artists.extend(
+        selected_artists.extend(
             self.plot_selected_line(el, details.classes)
         )
-        plot_element.selected_artists.extend(
+        selected_artists.extend(
             self.plot_line_segment(el, details.classes)
         )
-        plot_element.selected_artists.extend(self.plot_selected_points(el.points))
+        selected_artists.extend(self.plot_selected_points(el.points))
 
         annotate_points.extend(el.points)
-        for pt in annotate_points:
-            label = model[pt].label
-            plot_element.annotation_artists.extend(self.annotate_point(pt, label))
 
     if isinstance(el, spg.Circle):
-        typ = "circle"
-        eq = el.equation().simplify()
-        rad = sp.sqrtdenest(el.radius.simplify())
-        area = sp.sqrtdenest(el.area.simplify())
-        areaf = str(round(float(area.evalf()), 4))
-        description = f"${sp.latex(eq)} = 0$ \n $r = {sp.latex(rad)}$"
-
-        plot_element.main_artists.extend(self.plot_circle(el, details.classes))
-
         annotate_points.extend([el.center, details.pt_radius])
-        for pt in annotate_points:
-            label = model[pt].label
-            plot_element.annotation_artists.extend(self.annotate_point(pt, label))
-
-        p1_x, p1_y, p2_x, p2_y = el.bounds
-        p1 = spg.Point(p1_x, p1_y)
-        p2 = spg.Point(p2_x, p2_y)
-        plot_element.zoom_pts.append(p1)
-        plot_element.zoom_pts.append(p2)
-
-        radius_segment = spg.Segment(el.center, details.pt_radius)
-        plot_element.selected_artists.extend(
+
+        radius_segment = (el.center, details.pt_radius)
+        selected_artists.extend(
             self.plot_circle_radius(
                 radius_segment,
                 details.classes,
             )
         )
-        plot_element.selected_artists.extend(
+        selected_artists.extend(
             self.plot_selected_circle(
                 el,
                 details.classes,
             )
         )
-        plot_element.selected_artists.extend(
+        selected_artists.extend(
             self.plot_circle_points([el.center, details.pt_radius])
         )
 
     if isinstance(el, spg.Segment):
-        typ = "segment"
-        seg = sp.sqrtdenest(el.length.simplify())
-        segf = str(round(float(seg.evalf()), 4))
-        description = f"seg: ${sp.latex(seg)}$"
-        description += " $ \\approx " + segf + "$"
-
-        plot_element.main_artists.extend(self.plot_segment(el, details.classes))
-
         annotate_points.extend(el.points)
-        for pt in annotate_points:
-            label = model[pt].label
-            plot_element.annotation_artists.extend(self.annotate_point(pt, label))
-
-        plot_element.zoom_pts.extend(el.points)
-        plot_element.selected_artists.extend(self.plot_selected_points(el.points))
+        selected_artists.extend(self.plot_selected_points(el.points))
 
     if isinstance(el, spg.Polygon):
-        typ = "polygon"
-        area = sp.sqrtdenest(el.area.simplify())
-        areaf = str(round(float(area.evalf()), 4))
-        perim = sp.sqrtdenest(el.perimeter.simplify())
-        perimf = str(round(float(perim.evalf()), 4))
-        description = f"area: ${sp.latex(area)} \\approx {areaf}$ "
-        description += "\n"
-        description += f"perim: ${sp.latex(perim)} \\approx {perimf}$"
-
-        plot_element.main_artists.extend(self.plot_polygon([el], details.classes))
-
         annotate_points.extend(el.vertices)
-        for pt in annotate_points:
-            label = model[pt].label
-            plot_element.annotation_artists.extend(self.annotate_point(pt, label))
-
-        # TODO: refactor plot_polygons
-        plot_element.zoom_pts.extend(el.vertices)
-        plot_element.selected_artists.extend(self.plot_selected_points(el.vertices))
+        selected_artists.extend(self.plot_selected_points(el.vertices))
 
     if isinstance(el, Wedge):
-        typ = "wedge"
-        area = sp.sqrtdenest(el.area.simplify())
-        areaf = str(round(float(area.evalf()), 4))
-        perim = sp.sqrtdenest(el.perimeter.simplify())
-        perimf = str(round(float(perim.evalf()), 4))
-        description = f"area: ${sp.latex(area)} \\approx {areaf}$ "
-        # TODO: determine why radians create and error
-        #  description += "\n"
-        #  description += f"rad: ${sp.latex(el.radians)} \n deg: {sp.latex(el.degrees)}$"
-
-        plot_element.main_artists.extend(self.plot_wedge(el, details.classes))
-
         annotate_points.extend(
             [el.pt_center, el.pt_radius, el.start_point, el.end_point]
         )
-        for pt in annotate_points:
-            label = model[pt].label
-            plot_element.annotation_artists.extend(self.annotate_point(pt, label))
+        selected_artists.extend(self.plot_selected_points(el.points))
 
-        plot_element.zoom_pts.extend(el.points)
+    for pt in annotate_points:
+        label = model[pt].label
+        annotation_artists.extend(self.annotate_point(pt, label))
 
-        plot_element.selected_artists.extend(self.plot_selected_points(el.points))
-
-    plot_element.footer_artists.extend(
-        self.plot_footer(f"{index:03}", description, details.label)
+    description = describe(el, details)
+    plot_element.set_description(description)
+    footer_artists = self.plot_footer(
+        f"{plot_element.index:03}", description, details.label
     )
 
-
-    # TODO: selected set by caller
-    #  self.selected = selected
-
-    # TODO: draw should be done by the caller
-    #  plt.draw()
+    plot_element.add_artists("selected", selected_artists)
+    plot_element.add_artists("annotation", annotation_artists)
+    plot_element.add_artists("footer", footer_artists)
 
     return plot_element
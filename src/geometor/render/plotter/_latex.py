@@ -0,0 +1,62 @@
+"""
+batched latex compilation for usetex text
+
+matplotlib compiles each usetex string lazily, one ``latex`` process per
+string, the first time it is drawn - here every string of a job is compiled
+up front on a few threads so the processes overlap and the frames only read
+from the matplotlib tex cache
+"""
+# permits forward reference for Plotter class
+from __future__ import annotations
+
+from ..common import *
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+
+from matplotlib.texmanager import TexManager
+
+# latex runs in a subprocess, so threads overlap without holding the GIL
+TEX_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def tex_lines(text: str) -> list[str]:
+    """split a string into the lines :class:`matplotlib.text.Text` sends to
+    latex one at a time"""
+    return [line for line in str(text).split("\n") if line.strip()]
+
+
+def _compile(job: tuple) -> None:
+    tex, size, dpi = job
+    texmanager = TexManager()
+    texmanager.make_dvi(tex, size)
+    if dpi:
+        texmanager.make_png(tex, size, dpi)
+
+
+def compile_tex(jobs, workers: int = None) -> int:
+    """
+    compile latex strings into the matplotlib tex cache
+
+    parameters
+    ----------
+    - ``jobs`` : iterable of ``(tex, size, dpi)`` - ``dpi`` also renders the
+      png used by the agg backend, ``None`` builds the dvi only
+    - ``workers`` : :class:`int`: threads running latex, defaults to
+      :data:`TEX_WORKERS`
+
+    returns the number of distinct strings compiled - strings already in the
+    cache return immediately
+    """
+    jobs = list(dict.fromkeys(jobs))
+    if not jobs:
+        return 0
+    workers = workers or TEX_WORKERS
+    if workers > 1 and len(jobs) > 1:
+        with ThreadPoolExecutor(workers) as executor:
+            # consume the results to raise the first latex error here
+            list(executor.map(_compile, jobs))
+    else:
+        for job in jobs:
+            _compile(job)
+    return len(jobs)
@@ -23,9 +23,7 @@ def _plot_line(
     if classes is None:
         classes = []
 
-    ends = plotter.bounds.intersection(line)
-    xs = [pt.x.evalf() for pt in ends]
-    ys = [pt.y.evalf() for pt in ends]
+    xs, ys = plotter.clip_line(line)
 
     styles = get_styles("line", classes)
     return plotter.ax_main.plot(xs, ys, **styles)
@@ -42,9 +40,7 @@ def _plot_selected_line(
     if classes is None:
         classes = []
 
-    ends = plotter.bounds.intersection(line)
-    xs = [pt.x.evalf() for pt in ends]
-    ys = [pt.y.evalf() for pt in ends]
+    xs, ys = plotter.clip_line(line)
 
     styles = get_styles("line", classes)
     styles.update(get_styles("line_selected", classes))
@@ -0,0 +1,208 @@
+"""
+numpy mirror of a geometor model for rendering
+
+the model is evaluated once into float arrays so the draw path never has to
+call sympy
+"""
+# permits forward reference for Plotter class
+from __future__ import annotations
+
+from ..common import *
+
+from itertools import islice
+
+from ..utils import Extents
+from ._coords import CoordCache
+from ._wedges import Wedge
+
+
+class NumericModel:
+    """
+    float64 arrays compiled from a :class:`geometor.model.Model`
+
+    parameters
+    ----------
+    - ``model`` : :class:`geometor.model.Model`: the model to compile
+    - ``coords`` : :class:`CoordCache`: optional cache to evaluate into -
+      sharing the plotter cache seeds it with every element in the model
+
+    attributes
+    ----------
+    - :attr:`points` -> ``(N, 2)`` array of ``x, y``
+    - :attr:`lines` -> ``(N, 3)`` array of ``a, b, c`` for ``ax + by + c = 0``
+    - :attr:`segments` -> ``(N, 4)`` array of ``x1, y1, x2, y2``
+    - :attr:`circles` -> ``(N, 3)`` array of ``cx, cy, r``
+    - :attr:`polygon_vertices` -> ``(V, 2)`` vertices of all polygons
+    - :attr:`polygon_offsets` -> ``(P + 1,)`` start of each polygon in the
+      vertex array
+    - :attr:`wedges` -> ``(N, 3)`` array of ``cx, cy, r`` for each wedge circle
+    - :attr:`wedge_vertices` -> ``(V, 2)`` points of all wedges
+    - :attr:`wedge_offsets` -> ``(W + 1,)`` start of each wedge in the vertex
+      array
+
+    each row maps back to its sympy element and details through
+    :attr:`elements` - a dict of ``kind`` to a list of elements in row order -
+    and :meth:`row`
+
+    call :meth:`update` after adding elements to the model to compile just
+    the new elements - :attr:`extents` keeps the running limits of the points
+    and of the bounding boxes of circles and wedge circles, like
+    :meth:`geometor.model.Model.limits`
+    """
+
+    KINDS = ("points", "lines", "segments", "circles", "polygons", "wedges")
+
+    def __init__(self, model: Model, coords: CoordCache = None):
+        self.model = model
+        self.coords = coords if coords is not None else CoordCache()
+
+        self.elements = {kind: [] for kind in self.KINDS}
+        self.details = {kind: [] for kind in self.KINDS}
+        self._index = {}
+        self._scanned = 0
+
+        self.points = np.empty((0, 2))
+        self.lines = np.empty((0, 3))
+        self.segments = np.empty((0, 4))
+        self.circles = np.empty((0, 3))
+        self.polygon_vertices = np.empty((0, 2))
+        self.polygon_offsets = np.zeros(1, dtype=np.intp)
+        self.wedges = np.empty((0, 3))
+        self.wedge_vertices = np.empty((0, 2))
+        self.wedge_offsets = np.zeros(1, dtype=np.intp)
+
+        self.extents = Extents()
+
+        self.update()
+
+    def update(self) -> int:
+        """
+        compile elements added to the model since the last update
+
+        only the new elements are evaluated and the running extents are
+        reduced over the new points and circles only - returns the number of
+        elements added
+        """
+        points = []
+        lines = []
+        segments = []
+        circles = []
+        polygon_vertices = []
+        polygon_offsets = []
+        wedges = []
+        wedge_vertices = []
+        wedge_offsets = []
+
+        polygon_count = len(self.polygon_vertices)
+        wedge_count = len(self.wedge_vertices)
+        added = 0
+
+        items = list(islice(self.model.items(), self._scanned, None))
+        self._scanned += len(items)
+
+        for el, details in items:
+            if isinstance(el, spg.Point):
+                kind = "points"
+                points.append(self.coords.point(el))
+
+            elif isinstance(el, spg.Line):
+                kind = "lines"
+                x1, y1, x2, y2 = self.coords.line(el)
+                lines.append((y1 - y2, x2 - x1, x1 * y2 - x2 * y1))
+
+            elif isinstance(el, spg.Segment):
+                kind = "segments"
+                segments.append(self.coords.line(el))
+
+            elif isinstance(el, spg.Circle):
+                kind = "circles"
+                circles.append(self.coords.circle(el))
+                self.coords.point(details.pt_radius)
+
+            elif isinstance(el, spg.Polygon):
+                kind = "polygons"
+                polygon_vertices.extend(self.coords.point(pt) for pt in el.vertices)
+                polygon_offsets.append(polygon_count + len(polygon_vertices))
+
+            elif isinstance(el, Wedge):
+                kind = "wedges"
+                wedges.append(self.coords.circle(el.circle))
+                wedge_vertices.extend(self.coords.point(pt) for pt in el.points)
+                wedge_offsets.append(wedge_count + len(wedge_vertices))
+                self.coords.point(el.start_point)
+                self.coords.point(el.end_point)
+
+            else:
+                continue
+
+            self._index[el] = (kind, len(self.elements[kind]))
+            self.elements[kind].append(el)
+            self.details[kind].append(details)
+            added += 1
+
+        if not added:
+            return 0
+
+        new_points = _rows(points, 2)
+        self.extents.add(new_points)
+        for new_circles in (_rows(circles, 3), _rows(wedges, 3)):
+            self.extents.add(_circle_boxes(new_circles))
+
+        self.points = np.concatenate([self.points, new_points])
+        self.lines = np.concatenate([self.lines, _rows(lines, 3)])
+        self.segments = np.concatenate([self.segments, _rows(segments, 4)])
+        self.circles = np.concatenate([self.circles, _rows(circles, 3)])
+        self.polygon_vertices = np.concatenate(
+            [self.polygon_vertices, _rows(polygon_vertices, 2)]
+        )
+        self.polygon_offsets = np.concatenate(
+            [self.polygon_offsets, np.array(polygon_offsets, dtype=np.intp)]
+        )
+        self.wedges = np.concatenate([self.wedges, _rows(wedges, 3)])
+        self.wedge_vertices = np.concatenate(
+            [self.wedge_vertices, _rows(wedge_vertices, 2)]
+        )
+        self.wedge_offsets = np.concatenate(
+            [self.wedge_offsets, np.array(wedge_offsets, dtype=np.intp)]
+        )
+
+        return added
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, element) -> bool:
+        return element in self._index
+
+    def row(self, element) -> tuple[str, int]:
+        """return the ``(kind, row)`` index of an element"""
+        return self._index[element]
+
+    def element(self, kind: str, row: int):
+        """return the sympy element for a row of the given kind"""
+        return self.elements[kind][row]
+
+    def polygon(self, row: int) -> np.ndarray:
+        """return the ``(V, 2)`` vertices of a polygon row"""
+        start, stop = self.polygon_offsets[row : row + 2]
+        return self.polygon_vertices[start:stop]
+
+    def wedge(self, row: int) -> np.ndarray:
+        """return the ``(V, 2)`` points of a wedge row"""
+        start, stop = self.wedge_offsets[row : row + 2]
+        return self.wedge_vertices[start:stop]
+
+    def limits(self) -> tuple[list, list]:
+        """return ``[xmin, xmax], [ymin, ymax]`` for all points and circles"""
+        return self.extents.limits()
+
+
+def _rows(values: list, width: int) -> np.ndarray:
+    return np.array(values, dtype=np.float64).reshape(-1, width)
+
+
+def _circle_boxes(circles: np.ndarray) -> np.ndarray:
+    """return the lower left and upper right corners of ``cx, cy, r`` rows"""
+    centers = circles[:, :2]
+    radii = circles[:, 2:3]
+    return np.concatenate([centers - radii, centers + radii])
@@ -0,0 +1,142 @@
+"""
+pooled overlay artists for selections and annotations
+
+each frame of a sequence highlights a few elements and labels their points,
+then takes the overlays down again - here the artists are kept in a pool,
+hidden between frames and updated in place when they are needed again
+"""
+# permits forward reference for Plotter class
+from __future__ import annotations
+
+from ..common import *
+from ..styles import *
+
+from ._points import _style_key
+from ._segments import _segment_points
+from ._text import TextCache, CachedText
+
+
+def _move_to_top(artist) -> None:
+    """move an artist to the end of its axes children - matplotlib draws
+    artists with equal zorder in that order"""
+    children = getattr(artist.axes, "_children", None)
+    if children is not None:
+        children.remove(artist)
+        children.append(artist)
+
+
+class OverlayPool:
+    """
+    reusable selection and annotation artists for a :class:`Plotter`
+
+    artists are pooled on their kind and resolved styles - a request takes a
+    hidden artist of the same key, updates its data, text or position and
+    shows it, so frames that need the same overlays as an earlier frame
+    create no new artists
+
+    a reused artist is moved to the end of the draw order of its axes, so
+    overlays with the same zorder draw in the order they were requested,
+    like new artists would - frames do not depend on when the pool created
+    an artist
+
+    call :meth:`clear` at the end of a frame to hide every overlay it used
+    """
+
+    def __init__(self, plotter: Plotter):
+        self.plotter = plotter
+        self._free = defaultdict(list)
+        self._used = []
+
+    def __len__(self) -> int:
+        """number of artists held by the pool, shown or hidden"""
+        return len(self._used) + sum(len(free) for free in self._free.values())
+
+    def _take(self, key: tuple, create):
+        free = self._free[key]
+        if free:
+            artist = free.pop()
+            artist.set_visible(True)
+            _move_to_top(artist)
+        else:
+            artist = create()
+        self._used.append((key, artist))
+        return artist
+
+    def _line2d(self, kind: str, styles: dict, xs, ys) -> list:
+        artist = self._take(
+            (kind, _style_key(styles)),
+            lambda: self.plotter.ax_main.plot([], [], **styles)[0],
+        )
+        artist.set_data(xs, ys)
+        return [artist]
+
+    def points(self, pts: list[spg.Point], style_type: str = "point_selected") -> list:
+        """mark points like :meth:`Plotter.plot_selected_points`"""
+        xs, ys = self.plotter.coords.points(pts)
+        return self._line2d("points", get_styles(style_type), xs, ys)
+
+    def segment(
+        self, segment, style_type: str = "segment", classes: list = None
+    ) -> list:
+        """draw a segment like :meth:`Plotter.plot_segment` - a pair of points
+        is drawn as is"""
+        xs, ys = self.plotter.coords.points(_segment_points(segment))
+        styles = get_styles(style_type, classes if classes else [])
+        return self._line2d("segment", styles, xs, ys)
+
+    def line(self, line: spg.Line, classes: list = None) -> list:
+        """highlight a line like :meth:`Plotter.plot_selected_line`"""
+        classes = classes if classes else []
+        xs, ys = self.plotter.clip_line(line)
+        styles = get_styles("line", classes)
+        styles.update(get_styles("line_selected", classes))
+        return self._line2d("line", styles, xs, ys)
+
+    def circle(self, circle: spg.Circle, classes: list = None) -> list:
+        """highlight a circle like :meth:`Plotter.plot_selected_circle`"""
+        classes = classes if classes else []
+        cx, cy, radius = self.plotter.coords.circle(circle)
+        styles = get_styles("circle", classes)
+        styles.update(get_styles("circle_selected", classes))
+
+        def create():
+            patch = plt.Circle((cx, cy), radius, **styles)
+            return self.plotter.ax_main.add_patch(patch)
+
+        patch = self._take(("circle", _style_key(styles)), create)
+        patch.set_center((cx, cy))
+        patch.set_radius(radius)
+        return [patch]
+
+    def annotate(self, point: spg.Point, text: str) -> list:
+        """label a point like :meth:`Plotter.annotate_point`"""
+        plotter = self.plotter
+        text = str(text)
+        cached = plotter.text_cache is not None and text and TextCache.supports(text)
+        key = ("annotation", plotter._needs_usetex(text), bool(cached))
+
+        if self._free[key]:
+            # counts the text path like a new annotation would
+            plotter.text_usetex(text)
+        artist = self._take(key, lambda: plotter.annotate_point(point, text)[0])
+
+        xy = plotter.coords.point(point)
+        if artist.get_text() != text:
+            artist.set_text(text)
+        if isinstance(artist, CachedText):
+            artist.set_position(xy)
+        else:
+            artist.xy = xy
+        return [artist]
+
+    def clear(self) -> None:
+        """hide every overlay shown since the last clear"""
+        for key, artist in self._used:
+            artist.set_visible(False)
+            self._free[key].append(artist)
+        self._used.clear()
+
+    def reset(self) -> None:
+        """forget all pooled artists - for when the axes were cleared"""
+        self._free.clear()
+        self._used.clear()
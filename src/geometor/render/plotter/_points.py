@@ -26,8 +26,9 @@ def _plot_point(
     main_artists = []
 
     # collect x, y values into separate arrays
-    xs = [pt.x.evalf()]
-    ys = [pt.y.evalf()]
+    x, y = plotter.coords.point(pt)
+    xs = [x]
+    ys = [y]
 
     # plots the corresponding black underdot to separate the white dot from the
     # intersecting structs
@@ -70,8 +71,7 @@ def _plot_selected_points(
     plotter: Plotter,
     pts: list[spg.Point],
 ) -> list:
-    xs = [pt.x.evalf() for pt in pts]
-    ys = [pt.y.evalf() for pt in pts]
+    xs, ys = plotter.coords.points(pts)
 
     styles = get_styles("point_selected")
     return plotter.ax_main.plot(xs, ys, **styles)
@@ -81,8 +81,121 @@ def _plot_circle_points(
     plotter: Plotter,
     pts: list[spg.Point],
 ) -> list:
-    xs = [pt.x.evalf() for pt in pts]
-    ys = [pt.y.evalf() for pt in pts]
+    xs, ys = plotter.coords.points(pts)
 
     styles = get_styles("circle_points")
     return plotter.ax_main.plot(xs, ys, **styles)
+
+
+POINT_LAYERS = ("point_outer", "point_inner", "point_highlight")
+
+
+def _style_key(styles: dict) -> tuple:
+    return tuple(sorted((key, repr(value)) for key, value in styles.items()))
+
+
+class PointLayer:
+    """
+    many points drawn as one marker artist per distinct style
+
+    each of ``point_outer``, ``point_inner`` and - for points with classes -
+    ``point_highlight`` is resolved per point and points sharing a style share
+    an artist
+
+    hidden points keep their place in the artist data as ``nan``, so the
+    index of a point within an artist does not change with visibility
+
+    parameters
+    ----------
+    - ``ax`` : :class:`matplotlib.axes.Axes`: axes to draw on
+    - ``xy`` : ``(N, 2)`` array of point coordinates
+    - ``classes_list`` : list of classes for each point
+    - ``visible`` : optional ``(N,)`` bool mask, all visible by default
+
+    attributes
+    ----------
+    - :attr:`artists` -> :class:`list`: ``(layer, artist, rows)`` with the
+      point rows drawn by each artist in order
+    """
+
+    def __init__(
+        self,
+        ax,
+        xy: np.ndarray,
+        classes_list: list,
+        visible: np.ndarray = None,
+    ):
+        self.xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        if visible is None:
+            visible = np.ones(len(self.xy), dtype=bool)
+        self.visible = np.array(visible, dtype=bool)
+        self.artists = []
+
+        for layer in POINT_LAYERS:
+            groups = {}
+            for row, classes in enumerate(classes_list):
+                if layer == "point_highlight" and not classes:
+                    continue
+                styles = get_styles(layer, classes)
+                key = _style_key(styles)
+                if key not in groups:
+                    groups[key] = (styles, [])
+                groups[key][1].append(row)
+
+            for styles, rows in groups.values():
+                rows = np.array(rows, dtype=np.intp)
+                artist = ax.plot([], [], **styles)[0]
+                self.artists.append((layer, artist, rows))
+
+        self._update()
+
+    def __len__(self) -> int:
+        return len(self.xy)
+
+    def layer_artists(self, layer: str) -> list:
+        """return ``(artist, rows)`` for each artist of a layer"""
+        return [(artist, rows) for name, artist, rows in self.artists if name == layer]
+
+    def set_visible(self, visible: np.ndarray) -> None:
+        """set the visibility mask of all points"""
+        self.visible = np.array(visible, dtype=bool)
+        self._update()
+
+    def show(self, rows) -> None:
+        self.visible[rows] = True
+        self._update()
+
+    def hide(self, rows) -> None:
+        self.visible[rows] = False
+        self._update()
+
+    def _update(self) -> None:
+        for layer, artist, rows in self.artists:
+            shown = self.visible[rows]
+            xs = np.where(shown, self.xy[rows, 0], np.nan)
+            ys = np.where(shown, self.xy[rows, 1], np.nan)
+            artist.set_data(xs, ys)
+
+    def remove(self) -> None:
+        for layer, artist, rows in self.artists:
+            artist.remove()
+        self.artists = []
+
+
+def _plot_point_layer(
+    plotter: Plotter,
+    pts: list[spg.Point],
+    classes_list: list = None,
+    visible: np.ndarray = None,
+) -> PointLayer:
+    """plot many points as a :class:`PointLayer`
+
+    ``pts`` may be sympy points or an ``(N, 2)`` array of coordinates
+    """
+    if classes_list is None:
+        classes_list = [[]] * len(pts)
+    if isinstance(pts, np.ndarray):
+        xy = pts
+    else:
+        xy = [plotter.coords.point(pt) for pt in pts]
+    return PointLayer(plotter.ax_main, xy, classes_list, visible)
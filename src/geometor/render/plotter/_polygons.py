@@ -25,9 +25,9 @@ def _plot_polygon(
     else:
         if isinstance(poly, list):
             # Triangles are a list!?
-            xy = [(pt[0].evalf(), pt[1].evalf()) for pt in poly[0].vertices]
+            xy = [plotter.coords.point(pt) for pt in poly[0].vertices]
         else:
-            xy = [(pt.x.evalf(), pt.y.evalf()) for pt in poly.vertices]
+            xy = [plotter.coords.point(pt) for pt in poly.vertices]
 
         styles = get_styles("polygon", classes)
         patch = plt.Polygon(xy, **styles)
@@ -10,6 +10,12 @@ from ..styles import *
 #  from geometor.elements.render.plotter.plotter import Plotter
 
 
+def _segment_points(segment) -> list:
+    """the defining points of a segment or line - a pair of points is used as
+    is, so a circle radius needs no sympy segment"""
+    return getattr(segment, "points", segment)
+
+
 def _plot_segment(
     plotter: Plotter, segment: spg.Segment, style_type: str = None, classes: list = None
 ) -> list:
@@ -18,8 +24,7 @@ def _plot_segment(
     if classes is None:
         classes = []
 
-    xs = [pt.x.evalf() for pt in segment.points]
-    ys = [pt.y.evalf() for pt in segment.points]
+    xs, ys = plotter.coords.points(_segment_points(segment))
 
     styles = get_styles(style_type, classes)
     return plotter.ax_main.plot(xs, ys, **styles)
@@ -30,6 +35,7 @@ def _plot_line_segment(plotter: Plotter, line: spg.Line, classes: list = None) -
 
 
 def _plot_circle_radius(
-    plotter: Plotter, radius_segment: spg.Segment, classes: list = None
+    plotter: Plotter, radius_segment, classes: list = None
 ) -> list:
+    """draw a radius from a segment or a ``(center, pt_radius)`` pair"""
     return plotter.plot_segment(radius_segment, "circle_radius", classes)
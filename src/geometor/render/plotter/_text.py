@@ -0,0 +1,263 @@
+"""
+cached text rendering for the plotter
+
+with ``text.usetex`` every footer, header and label is laid out through
+latex and dvi parsing each time a frame is saved - here each string is
+converted to glyph paths once, kept in memory and on disk, and drawn as a
+path patch positioned like a :class:`matplotlib.text.Text`
+
+most strings do not need latex at all - :func:`mathtext_supported` checks
+whether the built-in mathtext can render a string instead
+"""
+# permits forward reference for Plotter class
+from __future__ import annotations
+
+from ..common import *
+
+import hashlib
+import os
+from functools import lru_cache
+
+from matplotlib.font_manager import FontProperties
+from matplotlib.mathtext import MathTextParser
+from matplotlib.patches import PathPatch
+from matplotlib.path import Path
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import Affine2D, ScaledTranslation
+
+# baseline to baseline distance of multiline text, in font sizes
+LINE_SPACING = 1.2
+
+# strings using these are drawn as regular text - paths carry no color
+_COLOR_COMMANDS = ("\\textcolor", "\\color")
+
+# latex only constructs that mathtext would print literally
+_USETEX_COMMANDS = ("\\begin", "\\end", "\\\\") + _COLOR_COMMANDS
+
+TEXT_MODES = ("usetex", "auto", "mathtext")
+
+_mathtext_parser = MathTextParser("path")
+
+
+@lru_cache(maxsize=None)
+def mathtext_supported(text: str) -> bool:
+    """return ``True`` if matplotlib mathtext can render the string
+
+    strings with latex environments, line breaks or color commands need
+    usetex - the rest are parsed line by line with the mathtext parser
+    """
+    if any(command in text for command in _USETEX_COMMANDS):
+        return False
+    prop = FontProperties()
+    for line in text.split("\n"):
+        if line.count("$") < 2:
+            continue
+        try:
+            _mathtext_parser.parse(line, 72, prop)
+        except ValueError:
+            return False
+    return True
+
+
+# rc settings that change the glyphs of a string
+_FONT_PARAMS = ("mathtext.fontset", "font.family")
+
+
+def _text_key(text: str, size: float, usetex: bool, ha: str) -> str:
+    preamble = plt.rcParams["text.latex.preamble"] if usetex else ""
+    fonts = [plt.rcParams[param] for param in _FONT_PARAMS]
+    content = "\n".join(
+        str(part) for part in (mp.__version__, fonts, usetex, size, ha, preamble, text)
+    )
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+class TextCache:
+    """
+    glyph paths keyed on ``(text, size, usetex, ha)``
+
+    color is applied to the patch when drawing, so one path serves every
+    color of the same string - the lines of multiline text are aligned to
+    each other with ``ha``, single lines share one path for every ``ha``
+
+    files on disk are also keyed on the matplotlib version and font
+    settings, so a font change does not serve stale glyphs
+
+    parameters
+    ----------
+    - ``cache_dir`` : :class:`str`: folder to keep paths across runs -
+      defaults to ``geometor-text`` in the matplotlib cache folder, ``False``
+      keeps paths in memory only
+    """
+
+    def __init__(self, cache_dir: str = None):
+        if cache_dir is None:
+            cache_dir = os.path.join(mp.get_cachedir(), "geometor-text")
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        self.cache_dir = cache_dir
+        self._paths = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    @staticmethod
+    def supports(text: str) -> bool:
+        """return ``False`` for strings that need a real text artist"""
+        return not any(command in text for command in _COLOR_COMMANDS)
+
+    def get_path(
+        self, text: str, size: float, usetex: bool = True, ha: str = "left"
+    ) -> Path:
+        """return the glyph path for the text with its baseline at the origin
+
+        multiline text is stacked with :data:`LINE_SPACING` and each line is
+        aligned with ``ha`` like :class:`matplotlib.text.Text` does
+        """
+        if "\n" not in text:
+            ha = "left"
+        key = (text, size, usetex, ha)
+        try:
+            path = self._paths[key]
+        except KeyError:
+            self.misses += 1
+            path = self._load(*key)
+            if path is None:
+                path = self._build(*key)
+                self._save(*key, path)
+            self._paths[key] = path
+        else:
+            self.hits += 1
+        return path
+
+    def prewarm(self, texts, size: float, usetex: bool = True, ha: str = "left") -> None:
+        for text in texts:
+            if text and self.supports(text):
+                self.get_path(text, size, usetex, ha)
+
+    def _build(self, text: str, size: float, usetex: bool, ha: str) -> Path:
+        paths = []
+        for i, line in enumerate(text.split("\n")):
+            if not line.strip():
+                continue
+            line_path = TextPath((0, 0), line, size=size, usetex=usetex)
+            (x0, _), (x1, _) = line_path.get_extents().get_points()
+            dx = {"left": 0, "center": -(x0 + x1) / 2, "right": -x1}[ha]
+            offset = Affine2D().translate(dx, -i * size * LINE_SPACING)
+            paths.append(line_path.transformed(offset))
+        if not paths:
+            return Path(np.empty((0, 2)))
+        return Path.make_compound_path(*paths)
+
+    def _file(self, text: str, size: float, usetex: bool, ha: str) -> str:
+        key = _text_key(text, size, usetex, ha)
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+    def _load(self, text: str, size: float, usetex: bool, ha: str) -> Path:
+        if not self.cache_dir:
+            return None
+        filename = self._file(text, size, usetex, ha)
+        if not os.path.exists(filename):
+            return None
+        with np.load(filename) as data:
+            return Path(data["vertices"], data["codes"])
+
+    def _save(
+        self, text: str, size: float, usetex: bool, ha: str, path: Path
+    ) -> None:
+        if not self.cache_dir:
+            return
+        codes = path.codes
+        if codes is None:
+            codes = np.full(len(path.vertices), Path.LINETO, dtype=Path.code_type)
+            if len(codes):
+                codes[0] = Path.MOVETO
+        filename = self._file(text, size, usetex, ha)
+        np.savez(filename, vertices=path.vertices, codes=codes)
+
+
+class CachedText(PathPatch):
+    """
+    a text string drawn from a :class:`TextCache` path
+
+    positioned at ``xy`` in ``base_transform`` coordinates, shifted by
+    ``offset`` points and aligned with ``ha`` and ``va`` like
+    :class:`matplotlib.text.Text`
+    """
+
+    def __init__(
+        self,
+        cache: TextCache,
+        text: str,
+        xy: tuple,
+        base_transform,
+        figure,
+        size: float = 12,
+        color="w",
+        ha: str = "left",
+        va: str = "baseline",
+        offset: tuple = (0, 0),
+        usetex: bool = True,
+        **kwargs,
+    ):
+        self._cache = cache
+        self._text = text
+        self._xy = xy
+        self._base_transform = base_transform
+        self._dpi_scale_trans = figure.dpi_scale_trans
+        self._size = size
+        self._ha = ha
+        self._va = va
+        self._offset = offset
+        self._usetex = usetex
+        kwargs.setdefault("linewidth", 0)
+        super().__init__(
+            self._cache.get_path(text, size, usetex, ha),
+            facecolor=color,
+            edgecolor="none",
+            **kwargs,
+        )
+        self._update_transform()
+
+    def _update_transform(self) -> None:
+        path = self.get_path()
+        if len(path.vertices):
+            (x0, y0), (x1, y1) = path.get_extents().get_points()
+        else:
+            x0 = y0 = x1 = y1 = 0
+
+        dx = {"left": -x0, "center": -(x0 + x1) / 2, "right": -x1}[self._ha]
+        dy = {
+            "baseline": 0,
+            "bottom": -y0,
+            "center": -(y0 + y1) / 2,
+            "center_baseline": -(y0 + y1) / 2,
+            "top": -y1,
+        }[self._va]
+
+        x, y = self._xy
+        self.set_transform(
+            Affine2D()
+            .translate(dx + self._offset[0], dy + self._offset[1])
+            .scale(1 / 72)
+            + self._dpi_scale_trans
+            + ScaledTranslation(x, y, self._base_transform)
+        )
+
+    def get_text(self) -> str:
+        return self._text
+
+    def set_text(self, text: str) -> None:
+        self._text = text
+        self.set_path(
+            self._cache.get_path(text, self._size, self._usetex, self._ha)
+        )
+        self._update_transform()
+        self.stale = True
+
+    def set_position(self, xy: tuple) -> None:
+        self._xy = xy
+        self._update_transform()
+        self.stale = True
@@ -14,43 +14,75 @@ from geometor.model import Wedge
 from rich import inspect
 
 
+def wedge_params(plotter: Plotter, wedges: list[Wedge]) -> tuple[np.ndarray, ...]:
+    """
+    convert wedges to :class:`matplotlib.patches.Wedge` parameters in one pass
+
+    angles are measured counterclockwise from the positive x axis with
+    ``atan2`` on the cached float coordinates
+
+    returns
+    -------
+    ``centers`` ``(N, 2)``, ``radii`` ``(N,)``, ``theta1`` ``(N,)`` and
+    ``theta2`` ``(N,)`` in degrees
+    """
+    coords = plotter.coords
+    circles = np.array(
+        [coords.circle(wedge.circle) for wedge in wedges], dtype=np.float64
+    ).reshape(-1, 3)
+    starts = np.array(
+        [coords.point(wedge.start_point) for wedge in wedges], dtype=np.float64
+    ).reshape(-1, 2)
+    ends = np.array(
+        [coords.point(wedge.end_point) for wedge in wedges], dtype=np.float64
+    ).reshape(-1, 2)
+
+    centers = circles[:, :2]
+    radii = circles[:, 2]
+
+    start_vecs = starts - centers
+    end_vecs = ends - centers
+    theta1 = np.degrees(np.arctan2(start_vecs[:, 1], start_vecs[:, 0]))
+    theta2 = np.degrees(np.arctan2(end_vecs[:, 1], end_vecs[:, 0]))
+
+    return centers, radii, theta1, theta2
+
+
 def _plot_wedge(
     plotter: Plotter,
     wedge: Wedge,
     classes: list = None,
 ) -> list[mp.patch.Wedge]:
     """takes a geometor.model.Wedge and maps it to a matplotlib patch"""
-    if classes is None:
-        classes = []
-
-    pt_center = wedge.circle.center
-    center = (float(pt_center.x.evalf()), float(pt_center.y.evalf()))
-    rad_val = float(wedge.circle.radius.evalf())
-    base_line = spg.Line(pt_center, spg.Point(pt_center.x + 1, pt_center.y))
-
-    # t = polygon
-    a1 = math.degrees(base_line.angle_between(wedge.start_ray).evalf())
-    a2 = math.degrees(base_line.angle_between(wedge.sweep_ray).evalf())
-    cy = center[1]
-    p1y = float(wedge.start_point.y.evalf())
-    if cy > p1y:
-        a1 = -a1
-    p2y = float(wedge.end_point.y.evalf())
-    if cy > p2y:
-        a2 = -a2
+    return _plot_wedges(plotter, [wedge], [classes])
 
-    styles = get_styles("wedge", classes)
-    patch = mp.patches.Wedge(
-        center,
-        rad_val,
-        a1,
-        a2,
-        **styles,
-    )
 
-    patch = plotter.ax_main.add_patch(patch)
-    return [patch]
+def _plot_wedges(
+    plotter: Plotter,
+    wedges: list[Wedge],
+    classes_list: list = None,
+) -> list[mp.patch.Wedge]:
+    """maps a list of geometor.model.Wedge to matplotlib patches
 
+    ``classes_list`` holds the classes for each wedge
+    """
+    if classes_list is None:
+        classes_list = [None] * len(wedges)
 
+    centers, radii, theta1, theta2 = wedge_params(plotter, wedges)
 
+    patches = []
+    for center, radius, a1, a2, classes in zip(
+        centers.tolist(), radii.tolist(), theta1.tolist(), theta2.tolist(), classes_list
+    ):
+        styles = get_styles("wedge", classes if classes else [])
+        patch = mp.patches.Wedge(
+            center,
+            radius,
+            a1,
+            a2,
+            **styles,
+        )
+        patches.append(plotter.ax_main.add_patch(patch))
 
+    return patches
@@ -17,6 +17,26 @@ def _get_points_from_sections(sections):
     return list(section_pts)
 
 
+def _section_description(section) -> str:
+    l1, l2 = section.lengths
+    f1, f2 = section.floats
+    description = r"\begin{align*}"
+    description += f"{sp.latex(l1)} \\ &: \\ {sp.latex(l2)}\\\\"
+    description += f"{f1:.6f}\\ldots \\ &: \\ {f2:.6f}\\ldots"
+    description += r"\end{align*}"
+    return description
+
+
+def _section_texts(model: Model, sections: list) -> list:
+    """return ``(text, size)`` for every string drawn by :func:`plot_section`"""
+    texts = []
+    for index, section in enumerate(sections):
+        texts.append((index, 24))
+        texts.append((_section_description(section), 20))
+        texts.append(("_".join(section.get_labels(model)), 24))
+        texts.extend((model[pt].label, 12) for pt in section.points)
+    return texts
+
 
 def plot_section(
     plotter: Plotter, model: Model, index, section, extensions=["svg", "png"]
@@ -26,20 +46,14 @@ def plot_section(
     """
     files = []
 
-    l1, l2 = section.lengths
-    f1, f2 = section.floats
-    description = r"\begin{align*}"
-    description += f"{sp.latex(l1)} \\ &: \\ {sp.latex(l2)}\\\\"
-    description += f"{f1:.6f}\\ldots \\ &: \\ {f2:.6f}\\ldots"
-    description += r"\end{align*}"
+    description = _section_description(section)
 
     section_pts = section.points
 
-    selected = []
-
-    selected.append(plotter.plot_selected_points(section_pts))
+    overlays = plotter.overlays
+    overlays.points(section_pts)
     for seg in section.segments:
-        selected.append(plotter.plot_segment(seg))
+        overlays.segment(seg)
 
     label = "_".join(section.get_labels(model))
 
@@ -48,35 +62,21 @@ def plot_section(
     folder = f"./{plotter.plot_name}/sections"
     filename = f"{index:05}"
 
-    for ext in extensions:
-        files.append(snapshot_2(folder, f"{filename}.{ext}"))
+    files.extend(plotter.snapshot(folder, filename, extensions))
 
     # annotate points
     for pt in section_pts:
         label = model[pt].label
-        selected.append(plotter.annotate_point(pt, label))
+        overlays.annotate(pt, label)
 
-    for ext in extensions:
-        files.append(snapshot_2(folder, f"{filename}-label.{ext}"))
+    files.extend(plotter.snapshot(folder, f"{filename}-label", extensions))
 
     # zoom around section points
-    x_limits, y_limits = get_limits_from_points(section_pts)
-    x_limits, y_limits = plotter._add_margin_to_ax_main_limits(x_limits, y_limits)
-    x_limits, y_limits = plotter._pad_ax_main_limits_for_aspect_ratio(
-        x_limits, y_limits
-    )
+    plotter.zoom_to_points(section_pts)
 
-    plotter.ax_main.set_xlim(x_limits[0], x_limits[1])
-    plotter.ax_main.set_ylim(y_limits[0], y_limits[1])
+    files.extend(plotter.snapshot(folder, f"{filename}-zoom", extensions))
 
-    for ext in extensions:
-        files.append(snapshot_2(folder, f"{filename}-zoom.{ext}"))
-
-    for select in selected:
-        #  print(f"{select=}")
-        #  breakpoint()
-        selected_el = select.pop(0)
-        selected_el.remove()
+    overlays.clear()
 
     # reset view after zoom
     plotter.set_ax_main_bounds(plotter.bounds)
@@ -89,11 +89,16 @@ def plot_sections(
 ):
     sections_pts = _get_points_from_sections(sections)
     plotter.set_plotter_limits_from_points(sections_pts)
+    plotter.compile_text(_section_texts(model, sections), extensions)
 
     files = []
 
-    for index, section in enumerate(sections):
-        files.extend(plot_section(plotter, model, index, section))
+    plotter.start_writer()
+    try:
+        for index, section in enumerate(sections):
+            files.extend(plot_section(plotter, model, index, section))
+    finally:
+        plotter.finish_writer()
 
     return files
 
@@ -110,7 +115,7 @@ def plot_all_sections(
             plotter.plot_segment(segment)
 
     folder = f"./{plotter.plot_name}/sections"
-    for ext in extensions:
-        files.append(snapshot_2(folder, f"all.{ext}"))
+    files.extend(plotter.snapshot(folder, "all", extensions))
+    plotter.save_manifests()
     return files
 
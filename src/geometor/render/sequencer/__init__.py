@@ -4,7 +4,9 @@ from ..common import *
 from ..styles import *
 
 from ._plot import _plot_sequence
+from ._layers import _plot_layers
 from ._step import _step_sequence
+from ._precompute import _precompute
 
 
 from ..plotter import Plotter
@@ -22,6 +24,9 @@ class Sequencer(Plotter):
     attributes:
         plot_name (str, optional): An optional name for the plot.
         margin (float, optional): An optional parameter to control the margins of the plot.
+        workers (int, optional): processes for precomputing descriptions -
+            defaults to the cpu count, ``1`` keeps the work in this process -
+            frames are sharded with ``plot_sequence(frame_workers=)``
         fig (Figure): Matplotlib figure object.
         ax (Axes): Matplotlib axes object for the main plot.
         ax_label (Axes): Matplotlib axes object for the label.
@@ -32,6 +37,11 @@ class Sequencer(Plotter):
         margin=0.1,
         FIG_W=16,
         FIG_H=9,
+        workers: int = None,
+        text_cache: bool = False,
+        text_mode: str = "usetex",
+        write_threads: int = 0,
+        skip_unchanged: bool = False,
     ):
         """
         Initializes the Sequencer with the given model and optional parameters.
@@ -41,12 +51,30 @@ class Sequencer(Plotter):
             model (Model): The geometric model to be processed and plotted.
             plot_name (str, optional): An optional name for the plot.
             margin (float, optional): An optional parameter to control the margins of the plot.
+            workers (int, optional): processes for precomputing descriptions.
+            text_cache (bool, optional): draw text from cached glyph paths.
+            text_mode (str, optional): ``usetex``, ``auto`` or ``mathtext``.
+            write_threads (int, optional): threads writing saved frames.
+            skip_unchanged (bool, optional): keep frames whose inputs did not
+                change since the last run.
         """
-        super().__init__(plot_name, margin, FIG_W, FIG_H)
+        super().__init__(
+            plot_name,
+            margin,
+            FIG_W,
+            FIG_H,
+            text_cache=text_cache,
+            text_mode=text_mode,
+            write_threads=write_threads,
+            skip_unchanged=skip_unchanged,
+        )
         self.selected = []
+        self.workers = workers
 
 
     plot_sequence = _plot_sequence
+    plot_layers = _plot_layers
     #  animate_sequence = _animate_sequence
     step_sequence = _step_sequence
+    precompute = _precompute
 
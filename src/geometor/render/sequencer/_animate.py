@@ -13,21 +13,15 @@ from .._html import _create_html_page
 
 from geometor.model import Wedge
 
+from ..descriptions import describe
+
 
 def _animate_sequence(self, model: Model, extensions=["svg", "png"]):
     """\
     Plots the sequence of all types of elements in layers for the given model.
     """
-    x_limits, y_limits = model.limits()
-    x_limits, y_limits = self._add_margin_to_ax_main_limits(x_limits, y_limits)
-    x_limits, y_limits = self._pad_ax_main_limits_for_aspect_ratio(x_limits, y_limits)
-
-    self.bounds = spg.Polygon(
-        spg.Point(x_limits[0], y_limits[1]),
-        spg.Point(x_limits[0], y_limits[0]),
-        spg.Point(x_limits[1], y_limits[0]),
-        spg.Point(x_limits[1], y_limits[1]),
-    )
+    numeric = self.load_model(model)
+    self.bounds = self.get_view_box(*numeric.limits())
     self.set_ax_main_bounds(self.bounds)
 
     cursor_points = []
@@ -47,10 +41,6 @@ def _animate_sequence(self, model: Model, extensions=["svg", "png"]):
 
         if isinstance(el, spg.Point):
             typ = "point"
-            label = (
-                f"$\\left\{{ \\ {sp.latex(el.x)}, \\ {sp.latex(el.y)} \\ \\right\}}$"
-            )
-
             pt_inner, *pts = self.plot_point(el, details.classes, add_to_cursors=False)
             cursor_points.append(pt_inner.pop())
             annotate_points.append(el)
@@ -70,9 +60,6 @@ def _animate_sequence(self, model: Model, extensions=["svg", "png"]):
 
         if isinstance(el, spg.Line):
             typ = "line"
-            eq = el.equation().simplify()
-            dist = sp.sqrtdenest(el.p1.distance(el.p2).simplify())
-            label = f"${sp.latex(eq)} = 0$ \n $d = {sp.latex(dist)}$"
             annotate_points.extend(el.points)
 
             self.plot_line(el, details.classes)
@@ -85,14 +72,8 @@ def _animate_sequence(self, model: Model, extensions=["svg", "png"]):
 
         if isinstance(el, spg.Circle):
             typ = "circle"
-            eq = el.equation().simplify()
-            rad = sp.sqrtdenest(el.radius.simplify())
-            area = sp.sqrtdenest(el.area.simplify())
-            areaf = str(round(float(area.evalf()), 4))
             annotate_points.extend([el.center, details.pt_radius])
 
-            label = f"${sp.latex(eq)} = 0$ \n $r = {sp.latex(rad)}$"
-
             self.plot_circle(el, details.classes)
 
             zoom_pts.extend(el.bounds)
@@ -114,29 +95,16 @@ def _animate_sequence(self, model: Model, extensions=["svg", "png"]):
 
         if isinstance(el, spg.Segment):
             typ = "segment"
-            seg = sp.sqrtdenest(el.length.simplify())
-            segf = str(round(float(seg.evalf()), 4))
             annotate_points.extend(el.points)
 
-            label = f"seg: ${sp.latex(seg)}$"
-            label += " $ \\approx " + segf + "$"
-
             self.plot_segment(el, details.classes)
             zoom_pts.extend(el.points)
             selected.append(self.plot_selected_points(el.points))
 
         if isinstance(el, spg.Polygon):
             typ = "polygon"
-            area = sp.sqrtdenest(el.area.simplify())
-            areaf = str(round(float(area.evalf()), 4))
-            perim = sp.sqrtdenest(el.perimeter.simplify())
-            perimf = str(round(float(perim.evalf()), 4))
             annotate_points.extend(el.vertices)
 
-            label = f"area: ${sp.latex(area)} \\approx {areaf}$ "
-            label += "\n"
-            label += f"perim: ${sp.latex(perim)} \\approx {perimf}$"
-
             # TODO: refactor plot_polygons
             self.plot_polygon([el], details.classes)
             zoom_pts.extend(el.vertices)
@@ -144,18 +112,10 @@ def _animate_sequence(self, model: Model, extensions=["svg", "png"]):
 
         if isinstance(el, Wedge):
             typ = "wedge"
-            area = sp.sqrtdenest(el.area.simplify())
-            areaf = str(round(float(area.evalf()), 4))
-            perim = sp.sqrtdenest(el.perimeter.simplify())
-            perimf = str(round(float(perim.evalf()), 4))
             annotate_points.extend(
                 [el.pt_center, el.pt_radius, el.start_point, el.end_point]
             )
 
-            label = f"area: ${sp.latex(area)} \\approx {areaf}$ "
-            label += "\n"
-            label += f"rad: ${sp.latex(el.radians)} \n deg: {sp.latex(el.degrees)}$"
-
             # TODO: refactor plot_polygons
             self.plot_wedge(el, details.classes)
             #  zoom_pts.extend(el.vertices)
@@ -166,7 +126,8 @@ def _animate_sequence(self, model: Model, extensions=["svg", "png"]):
             typ += "-"
             typ += "_".join(details.classes)
 
-        self.plot_footer(f"{i:03}", label, details.label)
+        description = describe(el, details)
+        self.plot_footer(f"{i:03}", description, details.label)
 
         steps_folder = f"./{self.plot_name}/steps"
         filename = f"{i:05}-{typ}"
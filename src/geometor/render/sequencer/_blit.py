@@ -0,0 +1,91 @@
+"""
+blitting for the interactive step sequencer
+
+a full ``plt.draw`` redraws every element, the header and the footer on each
+keypress - here the already visible elements are kept as a pixel background
+and only the artists of the current element are drawn over it
+"""
+
+from __future__ import annotations
+
+from ..common import *
+
+
+class StepBlitter:
+    """
+    redraws a figure by restoring a cached background and drawing only the
+    animated artists
+
+    the artists of the current step are marked animated with
+    :meth:`set_animated`, so a full draw leaves them out of the background -
+    every full draw recaptures the background through ``draw_event``
+
+    :meth:`step` adds artists that became static to the background without a
+    full draw - they are drawn over the background, so they can cover static
+    artists with a higher zorder until the next full :meth:`redraw`
+
+    backends without blitting fall back to full draws
+
+    parameters
+    ----------
+    - ``fig`` : :class:`matplotlib.figure.Figure`: the figure to draw
+    """
+
+    def __init__(self, fig):
+        self.fig = fig
+        self.canvas = fig.canvas
+        self.enabled = bool(getattr(self.canvas, "supports_blit", False))
+        self.background = None
+        self.animated = []
+        if self.enabled:
+            self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, event) -> None:
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self) -> None:
+        for artist in self.animated:
+            if artist.get_visible():
+                self.fig.draw_artist(artist)
+
+    def set_animated(self, artists: list) -> None:
+        """make ``artists`` the animated set - the previous set becomes
+        static again
+
+        without blitting nothing is marked - animated artists are left out of
+        the full draws used instead"""
+        if not self.enabled:
+            return
+        for artist in self.animated:
+            artist.set_animated(False)
+        self.animated = list(artists)
+        for artist in self.animated:
+            artist.set_animated(True)
+
+    def redraw(self) -> None:
+        """draw the full figure and recapture the background"""
+        if self.enabled:
+            self.canvas.draw()
+            self.canvas.blit(self.fig.bbox)
+        else:
+            plt.draw()
+
+    def step(self, static_artists: list = None) -> None:
+        """
+        add ``static_artists`` to the background, then draw the animated
+        artists over it
+        """
+        if not self.enabled or self.background is None:
+            self.redraw()
+            return
+
+        self.canvas.restore_region(self.background)
+        if static_artists:
+            for artist in static_artists:
+                if artist.get_visible():
+                    self.fig.draw_artist(artist)
+            self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+        self.canvas.blit(self.fig.bbox)
+        self.canvas.flush_events()
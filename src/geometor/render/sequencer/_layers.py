@@ -0,0 +1,122 @@
+"""
+incremental svg export of a sequence
+
+every step svg of :meth:`Sequencer.plot_sequence` holds all the elements
+drawn before it, so the output grows with the square of the model - here the
+figure is written once as a base document and each step adds two small
+layers, the geometry of its element and its overlays
+
+layers share the size and view of the base, so stacking the base, the
+geometry layers up to a step and the overlay layer of the step reproduces
+the step
+"""
+
+from __future__ import annotations
+
+from ..common import *
+
+from .._html import _create_layers_page
+
+
+def _layer_id(index: int, layer: str = None) -> str:
+    """stable id of a step layer - also the prefix of its artist gids"""
+    layer_id = f"step-{index:05}"
+    if layer:
+        layer_id += f"-{layer}"
+    return layer_id
+
+
+def _hide_figure(fig) -> list:
+    """hide every visible artist of the figure and return them, to show again
+    - artists added afterwards are the only ones drawn"""
+    hidden = []
+    for child in fig.get_children():
+        children = child.get_children() if child in fig.axes else [child]
+        for artist in children:
+            if artist.get_visible():
+                artist.set_visible(False)
+                hidden.append(artist)
+    return hidden
+
+
+def _save_layer(self, folder: str, layer_id: str, artists: list) -> str:
+    for n, artist in enumerate(artists):
+        artist.set_gid(f"{layer_id}-{n}")
+    return self.snapshot(folder, layer_id, ["svg"], transparent=True)[0]
+
+
+def _plot_layers(self, model: Model, output_path: str = None) -> dict:
+    """
+    write the sequence as a base svg and a geometry and overlay layer per
+    step, with a viewer page to step through them
+
+    each layer is a transparent svg named and grouped by a stable id -
+    ``step-00003`` for the geometry of step 3 and ``step-00003-overlay`` for
+    its selection, annotations and footer, with the artists inside as
+    ``<g id="step-00003-0">`` and so on
+
+    zoomed frames are left out - every layer shares the view of the base
+
+    parameters
+    ----------
+    - ``output_path`` : :class:`str`: the viewer page - defaults to
+      ``index.html`` in the layers folder
+
+    returns a dict with the ``base`` file, the ``main`` and ``overlay``
+    layer files in step order and the ``html`` page
+    """
+    self.open_description_store()
+    self.precompute(model)
+    self.compile_text(self.model_texts(model), ["svg"])
+    numeric = self.load_model(model)
+    self.prewarm_text(model)
+    self.bounds = self.get_view_box(*numeric.limits())
+    self.set_ax_main_bounds(self.bounds)
+    self.clip_model_lines()
+
+    folder = f"./{self.plot_name}/layers"
+    files = {"base": None, "main": [], "overlay": []}
+    plot_elements = []
+
+    self.start_writer()
+    try:
+        files["base"] = self.snapshot(folder, "base", ["svg"])[0]
+        base_artists = _hide_figure(self.fig)
+
+        for i, el in enumerate(model):
+            plot_element = self.plot_element_main(i, el, model)
+            plot_elements.append(plot_element)
+            files["main"].append(
+                _save_layer(self, folder, _layer_id(i), plot_element.main_artists)
+            )
+
+            # the geometry stays in its own layer from here on
+            plot_element.hide()
+            self.plot_element_overlays(plot_element, model)
+            overlay_artists = (
+                plot_element.selected_artists
+                + plot_element.annotation_artists
+                + plot_element.footer_artists
+            )
+            files["overlay"].append(
+                _save_layer(self, folder, _layer_id(i, "overlay"), overlay_artists)
+            )
+            plot_element.drop_overlays()
+    finally:
+        self.finish_writer()
+
+    for artist in base_artists:
+        artist.set_visible(True)
+    for plot_element in plot_elements:
+        plot_element.show()
+
+    if output_path is None:
+        output_path = f"{folder}/index.html"
+    files["html"] = _create_layers_page(
+        files["base"],
+        list(zip(files["main"], files["overlay"])),
+        output_path,
+    )
+    print_log(f"    * {files['html']}")
+
+    return files
@@ -0,0 +1,122 @@
+"""
+lazy overlays for the interactive step sequencer
+
+the main artists of every element are needed to show the build up to the
+current step, but the selection, annotation and footer overlays are only
+needed around the current step - they are built on demand, prefetched a few
+steps ahead and dropped again for steps far from the current one
+"""
+
+from __future__ import annotations
+
+from ..common import *
+
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from ..descriptions import describe, build_description
+
+
+class LazyOverlays:
+    """
+    builds :class:`PlotElement` overlays as the step UI reaches them
+
+    descriptions for the next ``ahead`` steps are built in a background
+    process, so the overlays are ready when the user steps forward - the
+    process runs simplification on its main thread, where the time budget of
+    :data:`describe` applies, and does not hold the GIL of the UI - matplotlib
+    artists are only created on the calling thread
+
+    at most ``keep`` elements hold overlays - the ones farthest from the
+    current step are dropped first
+
+    parameters
+    ----------
+    - ``plotter`` : :class:`Sequencer`: with ``plot_elements`` built by
+      :meth:`Plotter.plot_element_main`
+    - ``model`` : :class:`geometor.model.Model`
+    - ``keep`` : :class:`int`: elements to keep overlays for
+    - ``ahead`` : :class:`int`: steps to prefetch past the current one
+    """
+
+    def __init__(self, plotter, model: Model, keep: int = 64, ahead: int = 8):
+        self.plotter = plotter
+        self.model = model
+        self.keep = max(1, keep)
+        self.ahead = ahead
+        self._built = OrderedDict()
+        self._pending = {}
+        self._executor = ProcessPoolExecutor(max_workers=1)
+
+    def __len__(self) -> int:
+        return len(self._built)
+
+    def get(self, index: int):
+        """return the plot element at ``index`` with its overlays built"""
+        plot_element = self.plotter.plot_elements[index]
+        if not plot_element.has_overlays:
+            self._wait(index, plot_element.element)
+            self._build(plot_element)
+            plot_element.deselect()
+        self._built[index] = plot_element
+        self._built.move_to_end(index)
+        self._evict(index)
+        self.prefetch(index)
+        return plot_element
+
+    def _build(self, plot_element) -> None:
+        """build the overlays at the full view - clipped selections stay
+        whole when the user zooms out again"""
+        ax = self.plotter.ax_main
+        x_limits, y_limits = ax.get_xlim(), ax.get_ylim()
+        self.plotter.set_ax_main_bounds(self.plotter.bounds)
+        try:
+            self.plotter.plot_element_overlays(plot_element, self.model)
+        finally:
+            ax.set_xlim(x_limits)
+            ax.set_ylim(y_limits)
+
+    def prefetch(self, index: int) -> None:
+        """build descriptions for the steps after ``index`` in the background"""
+        plot_elements = self.plotter.plot_elements
+        for ahead in range(index + 1, min(index + 1 + self.ahead, len(plot_elements))):
+            el = plot_elements[ahead].element
+            if ahead in self._pending or describe.cached(el) is not None:
+                continue
+            future = self._executor.submit(build_description, el, describe.budget)
+            self._pending[ahead] = future
+            future.add_done_callback(
+                lambda future, ahead=ahead, el=el: self._done(ahead, el, future)
+            )
+
+    def _wait(self, index: int, el) -> None:
+        """take the description from a prefetch in flight instead of building
+        it again on this thread"""
+        future = self._pending.get(index)
+        if future is None or future.cancel():
+            return
+        try:
+            description, degraded = future.result()
+        except Exception:
+            # the overlays build the description themselves
+            return
+        if el not in describe:
+            describe.seed(el, description, degraded)
+
+    def _done(self, index: int, el, future) -> None:
+        self._pending.pop(index, None)
+        if future.cancelled() or future.exception() is not None:
+            return
+        if el not in describe:
+            describe.seed(el, *future.result())
+
+    def _evict(self, index: int) -> None:
+        while len(self._built) > self.keep:
+            farthest = max(self._built, key=lambda built: abs(built - index))
+            self._built.pop(farthest).drop_overlays()
+
+    def close(self) -> None:
+        """stop prefetching - queued descriptions are cancelled"""
+        for future in list(self._pending.values()):
+            future.cancel()
+        self._executor.shutdown(wait=False)
@@ -5,6 +5,9 @@ functions to plot models as a sequential build
 from __future__ import annotations
 
 from ..common import *
+
+from itertools import islice
+import multiprocessing
 from ..styles import *
 from ..utils import *
 from matplotlib.animation import FuncAnimation
@@ -13,203 +16,279 @@ from .._html import _create_html_page
 
 from geometor.model import Wedge
 
+from ..descriptions import describe, DescriptionStore
+
 #  from geometor.render.sequencer.sequencer import Sequencer
 
 
-def _plot_sequence(self, model: Model, extensions=["svg", "png"]):
+def _plot_sequence(
+    self, model: Model, extensions=["svg", "png"], frame_workers: int = 1
+) -> dict:
     """
     Plots the sequence of all types of elements in layers for the given model.
+
+    with ``frame_workers`` above one the steps are split into contiguous
+    shards rendered by forked processes - each process draws the elements
+    before its shard without saving frames, then saves the frames of its
+    shard - :attr:`Sequencer.workers` only sets the processes that
+    precompute descriptions
+
+    returns a dict of extension to the list of saved files, in the same order
+    as a serial run - platforms without ``fork`` render serially
     """
-    x_limits, y_limits = model.limits()
-    x_limits, y_limits = self._add_margin_to_ax_main_limits(x_limits, y_limits)
-    x_limits, y_limits = self._pad_ax_main_limits_for_aspect_ratio(x_limits, y_limits)
-
-    self.bounds = spg.Polygon(
-        spg.Point(x_limits[0], y_limits[1]),
-        spg.Point(x_limits[0], y_limits[0]),
-        spg.Point(x_limits[1], y_limits[0]),
-        spg.Point(x_limits[1], y_limits[1]),
-    )
+    self.open_description_store()
+    self.precompute(model)
+    self.compile_text(self.model_texts(model), extensions)
+    numeric = self.load_model(model)
+    self.prewarm_text(model)
+    self.bounds = self.get_view_box(*numeric.limits())
     self.set_ax_main_bounds(self.bounds)
+    self.clip_model_lines()
+
+    count = len(model)
+    parallel = (
+        frame_workers is not None
+        and frame_workers > 1
+        and count > 1
+        and "fork" in multiprocessing.get_all_start_methods()
+    )
 
-    cursor_points = []
-    files = {}
-    for ext in extensions:
-        files[ext] = []
+    if parallel:
+        files = _plot_shards(self, model, extensions, frame_workers)
+        # bring this figure to the state a serial run leaves it in
+        cursor_points = _replay_steps(self, model, count)
+        self.plot_footer("", _summary_label(model), "")
+    else:
+        files = {ext: [] for ext in extensions}
+        cursor_points = []
+        self.start_writer()
+        try:
+            for i, (el, details) in enumerate(model.items()):
+                _plot_step(
+                    self, model, i, el, details, extensions, files, cursor_points
+                )
+            _plot_summary(self, model, extensions, files)
+        finally:
+            self.finish_writer()
 
-    for i, (el, details) in enumerate(model.items()):
-        selected = []
-        zoom_pts = []
-        annotate_points = []
+    mplcursors.cursor(cursor_points, highlight=True)
 
-        if isinstance(el, spg.Point):
-            typ = "point"
-            label = (
-                f"$\\left\{{ \\ {sp.latex(el.x)}, \\ {sp.latex(el.y)} \\ \\right\}}$"
-            )
-
-            pt_inner, *pts = self.plot_point(el, details.classes, add_to_cursors=False)
-            cursor_points.append(pt_inner.pop())
-            annotate_points.append(el)
-            zoom_pts.append(el)
-            if "given" not in details.classes:
-                for parent in list(details.parents.keys())[0:2]:
-                    if isinstance(parent, spg.Line):
-                        selected.append(self.plot_selected_line(parent, []))
-                    if isinstance(parent, spg.Circle):
-                        selected.append(
-                            self.plot_selected_circle(
-                                parent,
-                                [],
-                            )
-                        )
-            selected.append(self.plot_selected_points([el]))
-
-        if isinstance(el, spg.Line):
-            typ = "line"
-            eq = el.equation().simplify()
-            dist = sp.sqrtdenest(el.p1.distance(el.p2).simplify())
-            label = f"${sp.latex(eq)} = 0$ \n $d = {sp.latex(dist)}$"
-            annotate_points.extend(el.points)
-
-            self.plot_line(el, details.classes)
-
-            zoom_pts.extend(el.points)
-
-            selected.append(self.plot_selected_line(el, details.classes))
-            selected.append(self.plot_line_segment(el, details.classes))
-            selected.append(self.plot_selected_points(el.points))
-
-        if isinstance(el, spg.Circle):
-            typ = "circle"
-            eq = el.equation().simplify()
-            rad = sp.sqrtdenest(el.radius.simplify())
-            area = sp.sqrtdenest(el.area.simplify())
-            areaf = str(round(float(area.evalf()), 4))
-            annotate_points.extend([el.center, details.pt_radius])
-
-            label = f"${sp.latex(eq)} = 0$ \n $r = {sp.latex(rad)}$"
-
-            self.plot_circle(el, details.classes)
-
-            p1_x, p1_y, p2_x, p2_y = el.bounds
-            p1 = spg.Point(p1_x, p1_y)
-            p2 = spg.Point(p2_x, p2_y)
-            zoom_pts.append(p1)
-            zoom_pts.append(p2)
-
-            selected.append(
-                self.plot_circle_radius(
-                    el.center,
-                    details.pt_radius,
-                    details.classes,
-                )
-            )
-            selected.append(
-                self.plot_selected_circle(
-                    el,
-                    details.classes,
-                )
-            )
-            selected.append(self.plot_circle_points([el.center, details.pt_radius]))
-
-        if isinstance(el, spg.Segment):
-            typ = "segment"
-            seg = sp.sqrtdenest(el.length.simplify())
-            segf = str(round(float(seg.evalf()), 4))
-            annotate_points.extend(el.points)
-
-            label = f"seg: ${sp.latex(seg)}$"
-            label += " $ \\approx " + segf + "$"
-
-            self.plot_segment(el, details.classes)
-            zoom_pts.extend(el.points)
-            selected.append(self.plot_selected_points(el.points))
-
-        if isinstance(el, spg.Polygon):
-            typ = "polygon"
-            area = sp.sqrtdenest(el.area.simplify())
-            areaf = str(round(float(area.evalf()), 4))
-            perim = sp.sqrtdenest(el.perimeter.simplify())
-            perimf = str(round(float(perim.evalf()), 4))
-            annotate_points.extend(el.vertices)
-
-            label = f"area: ${sp.latex(area)} \\approx {areaf}$ "
-            label += "\n"
-            label += f"perim: ${sp.latex(perim)} \\approx {perimf}$"
-
-            # TODO: refactor plot_polygons
-            self.plot_polygon([el], details.classes)
-            zoom_pts.extend(el.vertices)
-            selected.append(self.plot_selected_points(el.vertices))
-
-        if isinstance(el, Wedge):
-            typ = "wedge"
-            area = sp.sqrtdenest(el.area.simplify())
-            areaf = str(round(float(area.evalf()), 4))
-            perim = sp.sqrtdenest(el.perimeter.simplify())
-            perimf = str(round(float(perim.evalf()), 4))
-            annotate_points.extend(
-                [el.pt_center, el.pt_radius, el.start_point, el.end_point]
-            )
-
-            label = f"area: ${sp.latex(area)} \\approx {areaf}$ "
-            label += "\n"
-            label += f"rad: ${sp.latex(el.radians)} \n deg: {sp.latex(el.degrees)}$"
-
-            # TODO: refactor plot_polygons
-            self.plot_wedge(el, details.classes)
-            #  zoom_pts.extend(el.vertices)
-            #  selected.append(self.plot_selected_points(el.vertices))
-
-        # add classes to type name
-        if details.classes:
-            typ += "-"
-            typ += "_".join(details.classes)
-
-        self.plot_footer(f"{i:03}", label, details.label)
-
-        steps_folder = f"./{self.plot_name}/steps"
-        filename = f"{i:05}-{typ}"
+    #  _create_html_page(files['svg'], output_path=f"{self.plot_name}.html")
 
-        for ext in extensions:
-            files[ext].append(snapshot_2(steps_folder, f"{filename}.{ext}"))
+    return files
 
-        # annotate points
-        for pt in annotate_points:
-            label = model[pt].label
-            selected.append(self.annotate_point(pt, label))
 
-        for ext in extensions:
-            files[ext].append(snapshot_2(steps_folder, f"{filename}-label.{ext}"))
+def _steps_folder(self) -> str:
+    return f"./{self.plot_name}/steps"
 
-        # set zoom
-        if zoom_pts:
-            x_limits, y_limits = get_limits_from_points(zoom_pts)
-            x_limits, y_limits = self._add_margin_to_ax_main_limits(x_limits, y_limits)
-            x_limits, y_limits = self._pad_ax_main_limits_for_aspect_ratio(
-                x_limits, y_limits
-            )
 
-            self.ax_main.set_xlim(x_limits[0], x_limits[1])
-            self.ax_main.set_ylim(y_limits[0], y_limits[1])
+def _summary_label(model: Model) -> str:
+    return f"elements: {len(model)} • points: {len(model.points)}"
 
-            for ext in extensions:
-                files[ext].append(snapshot_2(steps_folder, f"{filename}-zoom.{ext}"))
 
-        # undo zoom
-        self.set_ax_main_bounds(self.bounds)
+def _plot_summary(self, model: Model, extensions: list, files: dict) -> None:
+    self.plot_footer("", _summary_label(model), "")
 
-        for select in selected:
-            selected_el = select.pop(0)
-            selected_el.remove()
+    _snapshot(self, _steps_folder(self), "summary", extensions, files)
 
-    label = f"elements: {len(model)} • points: {len(model.points)}"
-    self.plot_footer("", label, "")
 
-    for ext in extensions:
-        files[ext].append(snapshot_2(steps_folder, f"summary.{ext}"))
+def _snapshot(self, folder: str, basename: str, extensions: list, files: dict) -> None:
+    filenames = self.snapshot(folder, basename, extensions)
+    for ext, filename in zip(extensions, filenames):
+        files[ext].append(filename)
 
-    mplcursors.cursor(cursor_points, highlight=True)
 
-    #  _create_html_page(files['svg'], output_path=f"{self.plot_name}.html")
+def _plot_step(
+    self,
+    model: Model,
+    i: int,
+    el,
+    details,
+    extensions: list,
+    files: dict,
+    cursor_points: list,
+) -> None:
+    """plot one step of the sequence and save its frames to ``files``"""
+    steps_folder = _steps_folder(self)
+    overlays = self.overlays
+
+    zoom_pts = []
+    annotate_points = []
+
+    if isinstance(el, spg.Point):
+        typ = "point"
+        pt_inner, *pts = self.plot_point(el, details.label, details.classes)
+        cursor_points.append(pt_inner)
+        annotate_points.append(el)
+        zoom_pts.append(el)
+        if "given" not in details.classes:
+            for parent in list(details.parents.keys())[0:2]:
+                if isinstance(parent, spg.Line):
+                    overlays.line(parent)
+                if isinstance(parent, spg.Circle):
+                    overlays.circle(parent)
+        overlays.points([el])
+
+    if isinstance(el, spg.Line):
+        typ = "line"
+        annotate_points.extend(el.points)
+
+        self.plot_line(el, details.classes)
+
+        zoom_pts.extend(el.points)
+
+        overlays.line(el, details.classes)
+        overlays.segment(el, "line_segment", details.classes)
+        overlays.points(el.points)
+
+    if isinstance(el, spg.Circle):
+        typ = "circle"
+        annotate_points.extend([el.center, details.pt_radius])
+
+        self.plot_circle(el, details.classes)
+
+        cx, cy, r = self.coords.circle(el)
+        zoom_pts.append((cx - r, cy - r))
+        zoom_pts.append((cx + r, cy + r))
+
+        overlays.segment(
+            (el.center, details.pt_radius),
+            "circle_radius",
+            details.classes,
+        )
+        overlays.circle(el, details.classes)
+        overlays.points([el.center, details.pt_radius], "circle_points")
+
+    if isinstance(el, spg.Segment):
+        typ = "segment"
+        annotate_points.extend(el.points)
+
+        self.plot_segment(el, classes=details.classes)
+        zoom_pts.extend(el.points)
+        overlays.points(el.points)
+
+    if isinstance(el, spg.Polygon):
+        typ = "polygon"
+        annotate_points.extend(el.vertices)
+
+        # TODO: refactor plot_polygons
+        self.plot_polygon([el], details.classes)
+        zoom_pts.extend(el.vertices)
+        overlays.points(el.vertices)
+
+    if isinstance(el, Wedge):
+        typ = "wedge"
+        annotate_points.extend(
+            [el.pt_center, el.pt_radius, el.start_point, el.end_point]
+        )
+
+        # TODO: refactor plot_polygons
+        self.plot_wedge(el, details.classes)
+        #  zoom_pts.extend(el.vertices)
+        #  selected.append(self.plot_selected_points(el.vertices))
+
+    # add classes to type name
+    if details.classes:
+        typ += "-"
+        typ += "_".join(details.classes)
+
+    description = describe(el, details)
+    self.plot_footer(f"{i:03}", description, details.label)
+
+    filename = f"{i:05}-{typ}"
+
+    _snapshot(self, steps_folder, filename, extensions, files)
+
+    # annotate points
+    for pt in annotate_points:
+        label = model[pt].label
+        overlays.annotate(pt, label)
+
+    _snapshot(self, steps_folder, f"{filename}-label", extensions, files)
+
+    # set zoom
+    if zoom_pts:
+        self.zoom_to_points(zoom_pts)
+
+        _snapshot(self, steps_folder, f"{filename}-zoom", extensions, files)
+
+    # undo zoom
+    self.set_ax_main_bounds(self.bounds)
+
+    overlays.clear()
+
+
+def _replay_steps(self, model: Model, stop: int) -> list:
+    """
+    draw the elements and footers of the steps before ``stop`` without
+    saving frames, leaving the figure as the serial run has it before step
+    ``stop`` - returns the point artists for cursors
+    """
+    cursor_points = []
+    for i, (el, details) in enumerate(islice(model.items(), stop)):
+        main_artists = self.plot_element_main(i, el, model).main_artists
+        if isinstance(el, spg.Point):
+            cursor_points.append(main_artists[0])
+        self.plot_footer(f"{i:03}", describe(el, details), details.label)
+    return cursor_points
+
+
+# sequencer, model and extensions for the forked shard workers
+_shard_job = None
+
+
+def _plot_shard(shard: tuple) -> tuple[dict, dict]:
+    """worker - replay the steps before the shard and save its frames
+
+    returns the files of the shard and its manifest changes - the parent
+    saves the manifests, so workers do not overwrite each other
+    """
+    self, model, extensions = _shard_job
+    start, stop = shard
+
+    # sqlite connections must not be shared with the parent process
+    if describe.store is not None:
+        describe.store = DescriptionStore(describe.store.path)
+
+    _replay_steps(self, model, start)
+
+    # writer threads of the parent do not survive the fork
+    self.writer = None
+    self.start_writer()
+
+    files = {ext: [] for ext in extensions}
+    try:
+        for i, (el, details) in enumerate(islice(model.items(), start, stop), start):
+            _plot_step(self, model, i, el, details, extensions, files, [])
+        if stop == len(model):
+            _plot_summary(self, model, extensions, files)
+    finally:
+        self.finish_writer(save_manifests=False)
+    return files, self.manifest_changes()
+
+
+def _plot_shards(self, model: Model, extensions: list, workers: int) -> dict:
+    """render contiguous shards of steps on forked processes and merge the
+    file lists in step order"""
+    global _shard_job
+
+    count = len(model)
+    workers = min(workers, count)
+    bounds = [count * shard // workers for shard in range(workers + 1)]
+    shards = list(zip(bounds[:-1], bounds[1:]))
+
+    _shard_job = (self, model, extensions)
+    try:
+        with multiprocessing.get_context("fork").Pool(workers) as pool:
+            results = pool.map(_plot_shard, shards, chunksize=1)
+    finally:
+        _shard_job = None
+
+    files = {ext: [] for ext in extensions}
+    for shard_files, changes in results:
+        for ext in extensions:
+            files[ext].extend(shard_files[ext])
+        for folder, frames in changes.items():
+            self.manifest(folder).update(frames)
+    self.save_manifests()
+    return files
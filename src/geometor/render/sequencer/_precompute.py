@@ -0,0 +1,72 @@
+"""
+precompute descriptions and float coordinates before rendering
+
+simplification is CPU bound and holds the GIL, so the elements are fanned
+out to a process pool - small models are evaluated in this process
+"""
+
+from __future__ import annotations
+
+from ..common import *
+
+from ..descriptions import describe, build_description
+from ..plotter import CoordCache
+
+# below this many pending elements, pool startup costs more than it saves
+PRECOMPUTE_MIN_ELEMENTS = 32
+
+
+def _evaluate_element(args) -> tuple:
+    """worker - return the description, degraded reasons and float
+    coordinates of an element"""
+    el, budget = args
+    description, degraded = build_description(el, budget)
+    return description, degraded, CoordCache().evaluate(el)
+
+
+def _precompute(self, model: Model, workers: int = None) -> int:
+    """
+    build descriptions and coordinates for every element of the model
+
+    results are returned in model order and seeded into the shared
+    description cache and the coordinate cache of the sequencer - elements
+    with a cached description are skipped
+
+    the description cache is grown to hold the whole model, so the results
+    are still in memory when the frames of the job are drawn
+
+    parameters
+    ----------
+    - ``workers`` : :class:`int`: process count, defaults to
+      :attr:`Sequencer.workers` - ``1`` evaluates in this process
+
+    returns the number of elements evaluated
+    """
+    if workers is None:
+        workers = self.workers
+    if workers is None:
+        workers = cpu_count()
+
+    if describe.maxsize < len(model):
+        describe.maxsize = len(model)
+
+    pending = [el for el in model if describe.cached(el) is None]
+    if not pending:
+        return 0
+
+    tasks = [(el, describe.budget) for el in pending]
+    if workers > 1 and len(pending) >= PRECOMPUTE_MIN_ELEMENTS:
+        chunksize = max(1, len(pending) // (workers * 4))
+        with Pool(workers) as pool:
+            results = pool.map(_evaluate_element, tasks, chunksize)
+    else:
+        results = [_evaluate_element(task) for task in tasks]
+
+    describe.seed_many(
+        (el, description, degraded)
+        for el, (description, degraded, values) in zip(pending, results)
+    )
+    for el, (description, degraded, values) in zip(pending, results):
+        self.coords.seed(el, values)
+
+    return len(pending)
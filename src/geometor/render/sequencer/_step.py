@@ -11,10 +11,15 @@ import matplotlib.animation as animation
 
 from geometor.model import Wedge
 
+from ._blit import StepBlitter
+from ._lazy import LazyOverlays
+
 
 class UIElements:
     def __init__(self, plotter_context):
         self.plotter_context = plotter_context
+        self.blitter = StepBlitter(plotter_context.fig)
+        self.lazy = None
         self.buttons = {}  # Add this line to store button references
         self.buttons['start'] = self.create_button(0, "start", self._go_to_start)
         self.buttons['prev'] = self.create_button(0.1, "prev", self._step_back)
@@ -27,9 +32,7 @@ class UIElements:
 
     def init_func(self):
         """Initial function to setup the animation"""
-        for element in self.plotter_context.plot_elements:
-            element.hide()
-        plt.draw()
+        self._go_to(0, draw=False)
 
     def _on_play(self, event):
         self.ani = animation.FuncAnimation(
@@ -62,20 +65,44 @@ class UIElements:
 
     def update(self, frame):
         if frame < len(self.plotter_context.plot_elements):
-            for i, element in enumerate(self.plotter_context.plot_elements):
-                if i < frame:
-                    element.hide()
-                    element.show()
-                elif i <= frame:
-                    element.show()
-                    element.select()
-                    element.annotate()
-                    element.show_footer()
-                else:
-                    element.hide()
+            # the animation draws the figure after each frame
+            self._go_to(frame, draw=False)
+
 
-            plt.draw()
+    def _go_to(self, index: int, draw: bool = True):
+        """
+        make ``index`` the current element by applying only the change from
+        the current state
 
+        elements before the current one show their main artists, the current
+        element is shown selected and annotated with its footer and later
+        elements are hidden - moving only touches the previous current element
+        and the elements between the two indexes
+        """
+        plotter = self.plotter_context
+        elements = plotter.plot_elements
+        previous = plotter.current_index
+
+        elements[previous].deselect()
+        if index > previous:
+            _set_main_visible(elements[previous + 1 : index], True)
+        elif index < previous:
+            _set_main_visible(elements[index + 1 : previous + 1], False)
+
+        current = self.lazy.get(index) if self.lazy else elements[index]
+        current.show()
+        current.select()
+        current.annotate()
+        current.show_footer()
+        plotter.current_index = index
+
+        self.blitter.set_animated(current.artists())
+        if draw:
+            if index == previous + 1:
+                # only the previous element joins the background
+                self.blitter.step(elements[previous].main_artists)
+            else:
+                self.blitter.redraw()
 
     def create_button(
         self, offset, label, on_click, color="lightgray", hovercolor="gray"
@@ -93,69 +120,20 @@ class UIElements:
         check.on_clicked(_toggle_buttons)
 
     def _go_to_start(self, event):
-        plotter = self.plotter_context
-        plotter.current_index = 0
-        for i, element in enumerate(plotter.plot_elements):
-            if i == 0:
-                element.show()
-                element.select()
-                element.annotate()
-                element.show_footer()
-            else:
-                element.hide()
-        plt.draw()
+        self._go_to(0)
 
     def _go_to_end(self, event):
-        plotter = self.plotter_context
-        plotter.current_index = len(plotter.plot_elements) - 1
-        for i, element in enumerate(plotter.plot_elements):
-            if i < plotter.current_index:
-                element.hide()
-                element.show()
-            elif i == plotter.current_index:
-                element.show()
-                element.select()
-                element.annotate()
-                element.show_footer()
-            else:
-                element.hide()
-        plt.draw()
+        self._go_to(len(self.plotter_context.plot_elements) - 1)
 
     def _step_back(self, event):
         plotter = self.plotter_context
         if plotter.current_index > 0:
-            plotter.current_index -= 1
-            for i, element in enumerate(plotter.plot_elements):
-                if i < plotter.current_index:
-                    element.hide()
-                    element.show()
-                elif i == plotter.current_index:
-                    element.show()
-                    element.select()
-                    element.annotate()
-                    element.show_footer()
-                else:
-                    element.hide()
-
-            plt.draw()
+            self._go_to(plotter.current_index - 1)
 
     def _step_forward(self, event):
         plotter = self.plotter_context
         if plotter.current_index < len(plotter.plot_elements) - 1:
-            plotter.current_index += 1
-            for i, element in enumerate(plotter.plot_elements):
-                if i < plotter.current_index:
-                    element.hide()
-                    element.show()
-                elif i == plotter.current_index:
-                    element.show()
-                    element.select()
-                    element.annotate()
-                    element.show_footer()
-                else:
-                    element.hide()
-
-            plt.draw()
+            self._go_to(plotter.current_index + 1)
 
     def _toggle_buttons(label):
         if label == "Zoom":
@@ -172,6 +150,13 @@ class UIElements:
         pass
 
 
+def _set_main_visible(elements: list, visible: bool) -> None:
+    """set the main artists of a range of elements in one pass"""
+    for element in elements:
+        for artist in element.main_artists:
+            artist.set_visible(visible)
+
+
 def _step_sequence(self, model: Model):
     """
     allow interactive stepping through the model
@@ -179,34 +164,31 @@ def _step_sequence(self, model: Model):
     print("\nstep sequence: ", model.name)
     ui = UIElements(self)
 
-    # set up model
-    # TODO: this should be one method on plotter
-    x_limits, y_limits = model.limits()
-    x_limits, y_limits = self._add_margin_to_ax_main_limits(x_limits, y_limits)
-    x_limits, y_limits = self._pad_ax_main_limits_for_aspect_ratio(x_limits, y_limits)
-
-    self.bounds = spg.Polygon(
-        spg.Point(x_limits[0], y_limits[1]),
-        spg.Point(x_limits[0], y_limits[0]),
-        spg.Point(x_limits[1], y_limits[0]),
-        spg.Point(x_limits[1], y_limits[1]),
-    )
+    # set up model - descriptions and overlays are built as steps are reached
+    self.open_description_store()
+    numeric = self.load_model(model)
+    self.bounds = self.get_view_box(*numeric.limits())
     self.set_ax_main_bounds(self.bounds)
+    self.clip_model_lines()
 
     # TODO: reintegrate cursor points
     cursor_points = []
 
     for index, el in enumerate(model):
-        print(index, el)
-        plot_element = self.plot_element(index, el, model)
+        plot_element = self.plot_element_main(index, el, model)
         plot_element.hide()
         self.plot_elements.append(plot_element)
 
+    ui.lazy = LazyOverlays(self, model)
+    self.fig.canvas.mpl_connect("close_event", lambda event: ui.lazy.close())
+
     self.current_index = 0
-    self.plot_elements[0].show()
-    self.plot_elements[0].select()
-    self.plot_elements[0].annotate()
-    self.plot_elements[0].show_footer()
+    first = ui.lazy.get(0)
+    first.show()
+    first.select()
+    first.annotate()
+    first.show_footer()
+    ui.blitter.set_animated(first.artists())
 
     mplcursors.cursor(cursor_points, highlight=True)
 
@@ -1,9 +1,109 @@
 """
 functions to plot utils
 """
+from __future__ import annotations
 
 from .common import *
 
+from typing import NamedTuple
+
+# resolution of saved raster frames
+SNAPSHOT_DPI = 120
+
+
+class ViewBox(NamedTuple):
+    """
+    float bounding box for the view limits of the main axes
+
+    cheap to build, compare and hash - use :meth:`to_polygon` only when a
+    sympy polygon is actually needed
+    """
+
+    xmin: float
+    xmax: float
+    ymin: float
+    ymax: float
+
+    @classmethod
+    def from_limits(cls, x_limits, y_limits) -> ViewBox:
+        return cls(
+            float(x_limits[0]),
+            float(x_limits[1]),
+            float(y_limits[0]),
+            float(y_limits[1]),
+        )
+
+    @classmethod
+    def from_polygon(cls, polygon: sp.Polygon) -> ViewBox:
+        """convert a bounds polygon as built by :func:`set_bounds`"""
+        xs = [float(pt.x.evalf()) for pt in polygon.vertices]
+        ys = [float(pt.y.evalf()) for pt in polygon.vertices]
+        return cls(min(xs), max(xs), min(ys), max(ys))
+
+    @property
+    def width(self) -> float:
+        return self.xmax - self.xmin
+
+    @property
+    def height(self) -> float:
+        return self.ymax - self.ymin
+
+    @property
+    def x_limits(self) -> list:
+        return [self.xmin, self.xmax]
+
+    @property
+    def y_limits(self) -> list:
+        return [self.ymin, self.ymax]
+
+    def with_margin(self, margin_ratio: float, default_margin=0.5) -> ViewBox:
+        """grow the box by a ratio of its size
+
+        if one side has no extent, the margin of the other side is used - if
+        both are empty, ``default_margin`` is used
+        """
+        width = self.width
+        height = self.height
+
+        if width:
+            x_margin = width * margin_ratio
+            y_margin = height * margin_ratio if height else x_margin
+        elif height:
+            y_margin = height * margin_ratio
+            x_margin = y_margin
+        else:
+            x_margin = default_margin
+            y_margin = default_margin
+
+        return ViewBox(
+            self.xmin - x_margin,
+            self.xmax + x_margin,
+            self.ymin - y_margin,
+            self.ymax + y_margin,
+        )
+
+    def padded_to_aspect(self, ratio: float) -> ViewBox:
+        """pad width or height so ``width / height`` matches ``ratio``"""
+        width = self.width
+        height = self.height
+        current_ratio = width / height
+
+        if current_ratio < ratio:
+            pad = ((height * ratio) - width) / 2
+            return ViewBox(self.xmin - pad, self.xmax + pad, self.ymin, self.ymax)
+        if current_ratio > ratio:
+            pad = ((width / ratio) - height) / 2
+            return ViewBox(self.xmin, self.xmax, self.ymin - pad, self.ymax + pad)
+        return self
+
+    def to_polygon(self) -> sp.Polygon:
+        return set_bounds(self.x_limits, self.y_limits)
+
+    def apply(self, ax) -> None:
+        """set the limits of the axes to the box"""
+        ax.set_xlim(self.xmin, self.xmax)
+        ax.set_ylim(self.ymin, self.ymax)
+
 
 def set_bounds(limx, limy) -> sp.Polygon:
     return sp.Polygon(
@@ -20,17 +120,21 @@ def snapshot(folder, filename):
     out = f'{sessions}/{folder}/'
     os.makedirs(out, exist_ok=True)
     filename = out + filename
-    plt.savefig(filename, dpi=120)
+    plt.savefig(filename, dpi=SNAPSHOT_DPI)
     print_log(f'    * {filename}')
     return filename
 
 
-def snapshot_2(folder, filename, transparent=False):
+def snapshot_2(folder, filename, transparent=False, writer=None):
+    """save the current figure to ``folder`` - a :class:`SnapshotWriter`
+    saves it in the background instead"""
+    if writer is not None:
+        return writer.save(folder, filename, transparent)
     import os
     folder = os.path.abspath(folder)
     os.makedirs(folder, exist_ok=True)
     filename = os.path.join(folder, filename)
-    plt.savefig(filename, dpi=120, transparent=transparent)
+    plt.savefig(filename, dpi=SNAPSHOT_DPI, transparent=transparent)
     print_log(f'    * {filename}')
     return filename
 
@@ -96,29 +200,71 @@ def adjust_lims(limx, limy, margin_ratio=0.1):
     return limx, limy
 
 
-def get_limits_from_points(pts):
-    '''find x, y limits from a set of points'''
-    limx = [0, 0]
-    limy = [0, 0]
-    if pts:
-        pt = list(pts)[0]
-        ptx = float(pt.x.evalf())
-        pty = float(pt.y.evalf())
-        limx[0] = ptx
-        limx[1] = ptx
-        limy[0] = pty
-        limy[1] = pty
-
-        for pt in pts:
-            ptx = float(pt.x.evalf())
-            pty = float(pt.y.evalf())
-            # print(x, y)
-            limx[0] = ptx if ptx < limx[0] else limx[0]
-            limx[1] = ptx if ptx > limx[1] else limx[1]
-            limy[0] = pty if pty < limy[0] else limy[0]
-            limy[1] = pty if pty > limy[1] else limy[1]
+def points_to_array(pts, coords=None) -> np.ndarray:
+    '''return an ``(N, 2)`` float array for a set of points
 
-    return limx, limy
+    accepts sympy points, ``(x, y)`` float tuples or an array - pass the
+    plotter ``coords`` cache to avoid evaluating sympy points again
+    '''
+    if isinstance(pts, np.ndarray):
+        return pts.astype(np.float64, copy=False).reshape(-1, 2)
+
+    def point(pt):
+        if isinstance(pt, tuple):
+            return pt
+        if coords is None:
+            return float(pt.x.evalf()), float(pt.y.evalf())
+        return coords.point(pt)
+
+    return np.array([point(pt) for pt in pts], dtype=np.float64).reshape(-1, 2)
+
+
+def get_limits_from_points(pts, coords=None):
+    '''find x, y limits from a set of points
+
+    ``pts`` may be anything accepted by :func:`points_to_array`
+    '''
+    xy = points_to_array(pts, coords)
+    if not len(xy):
+        return [0, 0], [0, 0]
+
+    xmin, ymin = xy.min(axis=0)
+    xmax, ymax = xy.max(axis=0)
+    return [float(xmin), float(xmax)], [float(ymin), float(ymax)]
+
+
+class Extents:
+    '''
+    running x, y extents of a growing set of points
+
+    each call to :meth:`add` only reduces the new points
+    '''
+
+    def __init__(self):
+        self.xmin = math.inf
+        self.xmax = -math.inf
+        self.ymin = math.inf
+        self.ymax = -math.inf
+
+    def __bool__(self) -> bool:
+        return self.xmin <= self.xmax
+
+    def add(self, xy: np.ndarray) -> None:
+        xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        if not len(xy):
+            return
+        xmin, ymin = xy.min(axis=0)
+        xmax, ymax = xy.max(axis=0)
+        self.xmin = min(self.xmin, float(xmin))
+        self.xmax = max(self.xmax, float(xmax))
+        self.ymin = min(self.ymin, float(ymin))
+        self.ymax = max(self.ymax, float(ymax))
+
+    def limits(self) -> tuple[list, list]:
+        '''return ``[xmin, xmax], [ymin, ymax]`` - zeros if empty'''
+        if not self:
+            return [0, 0], [0, 0]
+        return [self.xmin, self.xmax], [self.ymin, self.ymax]
 
 
 
@@ -0,0 +1,220 @@
+"""
+background writer for saved frames
+
+``plt.savefig`` renders, compresses and writes each frame before the next
+frame can be drawn - the :class:`SnapshotWriter` renders on the calling thread
+and hands png compression and file writes to a bounded thread pool
+
+a frame saved to several raster extensions is drawn once for all of them -
+see :func:`render_frame`
+"""
+from __future__ import annotations
+
+from .common import *
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from io import BytesIO
+import os
+import threading
+
+from PIL import Image
+
+from .utils import SNAPSHOT_DPI
+
+# extensions encoded from the shared agg buffer and their PIL format names
+RASTER_FORMATS = {
+    "png": "png",
+    "jpg": "jpeg",
+    "jpeg": "jpeg",
+    "tif": "tiff",
+    "tiff": "tiff",
+    "webp": "webp",
+}
+
+
+class SnapshotError(Exception):
+    """raised by :meth:`SnapshotWriter.close` when frames failed to write
+
+    :attr:`errors` holds a list of ``(filename, exception)``
+    """
+
+    def __init__(self, errors: list):
+        self.errors = errors
+        super().__init__(f"{len(errors)} snapshots failed, first: {errors[0][0]}")
+
+
+def _encode_raster(data, size: tuple, filename: str, image_format: str, dpi) -> None:
+    image = Image.frombuffer("RGBA", size, data, "raw", "RGBA", 0, 1)
+    if image_format == "jpeg":
+        image = image.convert("RGB")
+    image.save(filename, format=image_format, dpi=(dpi, dpi))
+
+
+def _write_bytes(buffer: BytesIO, filename: str) -> None:
+    with open(filename, "wb") as file:
+        file.write(buffer.getbuffer())
+
+
+def render_frame(
+    fig, filenames: dict, dpi=SNAPSHOT_DPI, transparent=False, encode=False
+) -> list:
+    """
+    draw a figure for every extension in ``filenames`` and return the jobs
+    that encode and write each file
+
+    when more than one raster format is saved - or ``encode`` is set - the
+    raster formats share a single agg draw and the rgba buffer is encoded to
+    each of them in the jobs - otherwise every format is one ``savefig``
+
+    parameters
+    ----------
+    - ``filenames`` : :class:`dict`: extension to full filename
+    - ``encode`` : :class:`bool`: leave compression of a single raster
+      format to the jobs, for writers that run them on other threads
+
+    returns a callable per file in the order of ``filenames`` - run them in
+    order or on any threads
+    """
+    jobs = {}
+
+    raster = [ext for ext in filenames if ext.lower() in RASTER_FORMATS]
+    if len(raster) == 1 and not encode:
+        raster = []
+    if raster:
+        buffer = BytesIO()
+        fig.savefig(buffer, format="rgba", dpi=dpi, transparent=transparent)
+        size = tuple(int(length) for length in fig.get_size_inches() * dpi)
+        data = buffer.getbuffer()
+        for ext in raster:
+            image_format = RASTER_FORMATS[ext.lower()]
+            jobs[ext] = partial(
+                _encode_raster, data, size, filenames[ext], image_format, dpi
+            )
+
+    for ext, filename in filenames.items():
+        if ext in raster:
+            continue
+        buffer = BytesIO()
+        fig.savefig(buffer, format=ext, dpi=dpi, transparent=transparent)
+        jobs[ext] = partial(_write_bytes, buffer, filename)
+
+    return [jobs[ext] for ext in filenames]
+
+
+def _frame_filenames(folder: str, basename: str, extensions: list) -> dict:
+    return {ext: os.path.join(folder, f"{basename}.{ext}") for ext in extensions}
+
+
+def save_frame(
+    folder: str,
+    basename: str,
+    extensions: list,
+    transparent=False,
+    fig=None,
+    dpi=SNAPSHOT_DPI,
+) -> list:
+    """save the figure as ``basename`` with each extension, drawing it once
+    for all raster formats - returns the filenames in extension order"""
+    fig = fig if fig is not None else plt.gcf()
+    folder = os.path.abspath(folder)
+    os.makedirs(folder, exist_ok=True)
+    filenames = _frame_filenames(folder, basename, extensions)
+    for job in render_frame(fig, filenames, dpi, transparent):
+        job()
+    for filename in filenames.values():
+        print_log(f"    * {filename}")
+    return list(filenames.values())
+
+
+class SnapshotWriter:
+    """
+    saves frames of a figure with compression and disk writes off the render
+    thread
+
+    frames are drawn by :func:`render_frame` on the calling thread - raster
+    encoding and file writes run in the pool
+
+    at most ``max_pending`` files wait in memory - saving blocks until a slot
+    is free, so a fast renderer cannot outrun the disk
+
+    errors are collected and raised together by :meth:`close`
+
+    parameters
+    ----------
+    - ``threads`` : :class:`int`: writer threads
+    - ``max_pending`` : :class:`int`: files in flight, defaults to twice the
+      thread count
+    - ``dpi`` : :class:`float`: resolution of raster frames
+    """
+
+    def __init__(self, threads: int = 2, max_pending: int = None, dpi=SNAPSHOT_DPI):
+        self.dpi = dpi
+        self._executor = ThreadPoolExecutor(max_workers=threads)
+        self._slots = threading.BoundedSemaphore(max_pending or 2 * threads)
+        self._folders = set()
+        self._errors = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> SnapshotWriter:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _folder(self, folder: str) -> str:
+        folder = os.path.abspath(folder)
+        if folder not in self._folders:
+            os.makedirs(folder, exist_ok=True)
+            self._folders.add(folder)
+        return folder
+
+    def save(self, folder: str, filename: str, transparent=False, fig=None) -> str:
+        """render the figure and queue the file - returns the full filename"""
+        basename, ext = os.path.splitext(filename)
+        return self.save_frame(folder, basename, [ext[1:]], transparent, fig)[0]
+
+    def save_frame(
+        self,
+        folder: str,
+        basename: str,
+        extensions: list,
+        transparent=False,
+        fig=None,
+    ) -> list:
+        """render the figure once for all extensions and queue the files -
+        returns the filenames in extension order"""
+        fig = fig if fig is not None else plt.gcf()
+        filenames = _frame_filenames(self._folder(folder), basename, extensions)
+
+        jobs = render_frame(fig, filenames, self.dpi, transparent, encode=True)
+        for job, filename in zip(jobs, filenames.values()):
+            self._slots.acquire()
+            try:
+                future = self._executor.submit(job)
+            except BaseException:
+                self._slots.release()
+                raise
+            future.add_done_callback(
+                lambda future, filename=filename: self._done(future, filename)
+            )
+
+        for filename in filenames.values():
+            print_log(f"    * {filename}")
+        return list(filenames.values())
+
+    def _done(self, future, filename: str) -> None:
+        self._slots.release()
+        error = future.exception()
+        if error is not None:
+            with self._lock:
+                self._errors.append((filename, error))
+
+    def close(self) -> None:
+        """wait for queued frames and raise :class:`SnapshotError` if any
+        failed"""
+        self._executor.shutdown(wait=True)
+        if self._errors:
+            for filename, error in self._errors:
+                print_log(f"    ! {filename}: {error}")
+            raise SnapshotError(self._errors)